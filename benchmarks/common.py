@@ -0,0 +1,45 @@
+import os
+import statistics
+import time
+
+# Benchmarks must never hit the real EVDS or a developer's series store
+os.environ.setdefault("TCMB_API_KEY", "benchmark")
+os.environ["SERIES_STORE_PATH"] = ""
+
+from tools.mock_evds.server import MockConfig, serve
+
+DAYS_PER_YEAR = 365
+
+
+def measure(func, repeat: int = 5, number: int = 1, setup=None) -> dict:
+    """
+    Time func() `repeat` times (each timing covers `number` calls) and summarize in seconds per call.
+    setup(), if given, runs before every timing and is not measured.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "max": max(timings),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def start_mock_server(**config) -> str:
+    """
+    Start a synthesizing mock EVDS server on a free port and point TCMBClient at it.
+    Returns the base URL.
+    """
+    server = serve(port=0, config=MockConfig(synthesize=True, **config))
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/igmevdsms-dis"
+    os.environ["TCMB_BASE_URL"] = base_url
+    return base_url
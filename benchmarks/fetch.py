@@ -0,0 +1,45 @@
+import json
+from datetime import date, timedelta
+from data.fetchers.decode import decode_items
+from data.fetchers.registry import INDICATORS
+from data.fetchers.tcmb import normalize
+from tools.mock_evds.server import MockConfig, build_items, load_fixtures
+from benchmarks.common import DAYS_PER_YEAR, measure
+
+HISTORY_YEARS = (1, 5, 30)
+END = date(2026, 9, 30)
+
+
+def payload(codes: list, years: int) -> bytes:
+    """
+    An EVDS JSON response body for the codes over the last `years` years, as the mock server would send it.
+    """
+    start = END - timedelta(days=DAYS_PER_YEAR * years)
+    items = build_items(load_fixtures(), MockConfig(synthesize=True), codes, start, END)
+    return json.dumps({"totalCount": len(items), "items": items}).encode()
+
+
+def run(repeat: int) -> list:
+    """
+    Decode + normalize cost per indicator, i.e. the work behind each TCMBClient.get_* call
+    once the response body has arrived.
+    """
+    results = []
+    for name, indicator in INDICATORS.items():
+        specs = indicator.select()
+        codes = [spec.code for spec in specs]
+        for years in HISTORY_YEARS:
+            body = payload(codes, years)
+            raw = decode_items(body, codes)
+            params = {"indicator": name, "years": years, "rows": len(raw), "payload_bytes": len(body)}
+            results.append({
+                "name": "decode",
+                "params": params,
+                "stats": measure(lambda: decode_items(body, codes), repeat, number=10),
+            })
+            results.append({
+                "name": "normalize",
+                "params": params,
+                "stats": measure(lambda: normalize(indicator, raw, specs), repeat, number=10),
+            })
+    return results
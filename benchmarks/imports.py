@@ -0,0 +1,82 @@
+"""
+Import-time budget for the app's startup path.
+
+    python -m benchmarks.imports --budget 1.5
+
+Imports every module app.py imports at top level in a fresh interpreter, and fails (exit 1) if that
+takes longer than the budget or pulls in a chart library, which page modules should load lazily.
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+from benchmarks.common import measure
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+# Only page modules may import these (streamlit itself already loads plotly's core, not plotly.express)
+LAZY_MODULES = ("plotly.express", "altair", "data.fetchers.tcmb")
+
+PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "loaded": [m for m in {lazy!r} if m in sys.modules]}}))
+"""
+
+
+def startup_modules(path: str = APP) -> list:
+    """
+    Modules app.py imports at top level, in order.
+    """
+    with open(path) as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return modules
+
+
+def probe() -> dict:
+    """
+    Cold import of the startup modules in a fresh interpreter: {"seconds": ..., "loaded": [lazy modules imported]}.
+    """
+    code = PROBE.format(modules=startup_modules(), lazy=LAZY_MODULES)
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run(repeat: int) -> list:
+    return [{"name": "startup_imports", "params": {}, "stats": measure(probe, repeat)}]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=float, default=1.5, help="seconds allowed for startup imports")
+    parser.add_argument("--repeat", type=int, default=3, help="runs; the fastest one is checked")
+    args = parser.parse_args()
+
+    results = [probe() for _ in range(args.repeat)]
+    seconds = min(r["seconds"] for r in results)
+    loaded = results[0]["loaded"]
+    print(f"Startup imports: {seconds:.3f}s (budget {args.budget:.3f}s)")
+    failed = False
+    if seconds > args.budget:
+        print("FAIL: startup import time is over budget")
+        failed = True
+    if loaded:
+        print(f"FAIL: startup imports pulled in {', '.join(loaded)}; import them from page modules instead")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from streamlit.testing.v1 import AppTest
+from benchmarks.common import measure
+
+PAGES = {
+    "overview": "from components.overview import show_overview\nshow_overview()",
+    "labor": "from components.labor import show_labor\nshow_labor()",
+    "production": "from components.production import show_production\nshow_production()",
+}
+
+
+def clear_caches():
+    import streamlit as st
+    from data.fetchers.tcmb import SHARED_INTERVALS
+    st.cache_data.clear()
+    SHARED_INTERVALS.clear()
+
+
+def run_page(script: str):
+    at = AppTest.from_string(script, default_timeout=120)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+
+def run(repeat: int) -> list:
+    """
+    Full page script time under Streamlit's AppTest against the mock server:
+    cold (every cache emptied, data fetched from the mock) and warm (served from caches).
+    """
+    results = []
+    for name, script in PAGES.items():
+        results.append({
+            "name": "page_cold",
+            "params": {"page": name},
+            "stats": measure(lambda: run_page(script), repeat, setup=clear_caches),
+        })
+        run_page(script)
+        results.append({
+            "name": "page_warm",
+            "params": {"page": name},
+            "stats": measure(lambda: run_page(script), repeat),
+        })
+    return results
@@ -0,0 +1,102 @@
+"""
+Benchmark suite for the EVDS fetch/decode path, indicator transforms and page rendering.
+
+    python -m benchmarks.run                                  # all suites, results to benchmarks/results/
+    python -m benchmarks.run --suite fetch --repeat 10 --output bench.json
+    python -m benchmarks.run --compare benchmarks/results/baseline.json
+
+Everything runs offline against the mock EVDS server (tools/mock_evds) with the series store disabled.
+Results are JSON: run metadata plus one record per measurement with its parameters and timing
+statistics in seconds. --compare flags measurements whose median grew past --threshold.
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+from benchmarks.common import start_mock_server
+
+SUITES = ("fetch", "transforms", "pages", "imports")
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def metadata() -> dict:
+    import numpy
+    import pandas
+    import streamlit
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+        "streamlit": streamlit.__version__,
+    }
+
+
+def result_key(result: dict) -> str:
+    return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+
+def compare(results: list, baseline_path: str, threshold: float) -> list:
+    """
+    Print median changes against a baseline file and return the measurements that regressed.
+    """
+    with open(baseline_path) as f:
+        baseline = {result_key(r): r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        before = baseline.get(result_key(result))
+        if before is None:
+            continue
+        ratio = result["stats"]["median"] / before["stats"]["median"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(result)
+            flag = "  REGRESSION"
+        print(f"{result['name']:<16} {json.dumps(result['params'], sort_keys=True):<80} x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", choices=SUITES, action="append", help="suite to run (repeatable, default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per measurement")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="baseline results file to compare medians against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="median slowdown counted as a regression")
+    args = parser.parse_args()
+
+    # The mock must be up before the client module reads TCMB_BASE_URL
+    start_mock_server()
+
+    results = []
+    for suite in args.suite or SUITES:
+        print(f"Running {suite} ...", file=sys.stderr)
+        results.extend(importlib.import_module(f"benchmarks.{suite}").run(args.repeat))
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    with open(output, "w") as f:
+        json.dump({"metadata": metadata(), "results": results}, f, indent=2)
+    print(f"Wrote {len(results)} measurements to {output}", file=sys.stderr)
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+from data.fetchers.derived import apply_derived
+from data.fetchers.registry import INDICATORS
+from benchmarks.common import measure
+
+MONTHS = (12, 60, 360)
+
+
+def cpi_frame(months: int) -> pd.DataFrame:
+    dates = pd.date_range("1996-01-01", periods=months, freq="MS")
+    index = 100 * np.cumprod(1 + np.random.default_rng(0).uniform(0, 0.04, months))
+    return pd.DataFrame({"Date": dates, "CPI_Index": index.astype("float32")})
+
+
+def run(repeat: int) -> list:
+    """
+    CPI YoY/MoM derivations (the registry's derived columns) at several history lengths.
+    """
+    derived = INDICATORS["cpi"].derived
+    results = []
+    for months in MONTHS:
+        df = cpi_frame(months)
+
+        def derive():
+            apply_derived(df, derived)
+
+        results.append({"name": "cpi_derivations", "params": {"months": months}, "stats": measure(derive, repeat, number=10)})
+    return results
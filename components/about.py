@@ -0,0 +1,41 @@
+import os
+import streamlit as st
+
+def render_about_page():
+    st.markdown("### ℹ️ About Turkish Macroeconomic Dashboard")
+    
+    st.markdown("""
+    **Turkish Macroeconomic Dashboard** is a real-time macroeconomic dashboard designed to track key indicators of the Turkish economy.
+    
+    #### 📡 Data Sources
+    All data is sourced directly from the **Central Bank of the Republic of Turkey (TCMB) Electronic Data Delivery System (EVDS)**.
+    - **API Endpoint**: `https://evds3.tcmb.gov.tr/igmevdsms-dis/`
+    - **Update Frequency**: Data is fetched in real-time upon user request.
+    
+    #### 🧮 Methodology & Notes
+    - **Inflation**: Consumer Price Index (CPI) $(2003=100)$ is used. 
+        - Annual Inflation (YoY) = $((Index_t / Index_{t-12}) - 1) * 100$
+        - Monthly Inflation (MoM) = $((Index_t / Index_{t-1}) - 1) * 100$
+    - **Interest Rates**: Due to API restrictions on the direct Policy Rate series (`TP.PY.P01`), we use the **Weighted Average Funding Cost** (`TP.APIFON4`) as a high-fidelity proxy. This rate closely tracks the official One-Week Repo Auction Rate.
+    - **Exchange Rates**: Daily buying rates for USD and EUR are fetched from TCMB. Weekends and holidays are forward-filled for continuous visualization.
+    - **Labor Market**: Data sourced from TCMB (via TÜİK) Household Labor Force Survey (Seasonally Adjusted).
+    
+    #### 🛠️ Tech Stack
+    - **Framework**: Streamlit
+    - **Data Processing**: Pandas, NumPy
+    - **Visualization**: Altair, Plotly
+    
+    ---
+    """)
+    
+    col_profile, col_text = st.columns([1, 4])
+    with col_profile:
+        current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        img_path = os.path.join(current_dir, "assets", "profile_pic.jpg")
+        st.image(img_path, width=120)
+    with col_text:
+        st.markdown("""
+        **b. yusuf coban**  
+        *Creator & Lead Developer*  
+        v0.2.0
+        """)
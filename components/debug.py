@@ -0,0 +1,80 @@
+import logging
+import streamlit as st
+import pandas as pd
+from config.settings import METRICS_FILE, METRICS_PORT
+from data.fetchers.metrics import METRICS, format_labels
+
+logger = logging.getLogger(__name__)
+
+
+@st.cache_resource
+def _metrics_server(port: int):
+    """
+    The /metrics server for this process, or None when the port is taken (e.g. by another
+    worker). Returning None instead of raising lets cache_resource remember the failure,
+    so it is logged once rather than on every rerun.
+    """
+    try:
+        return METRICS.serve(port=port)
+    except OSError as e:
+        logger.warning("Metrics server not started on port %s: %s", port, e)
+        return None
+
+
+def publish_metrics():
+    """
+    Export metrics for scraping: start the /metrics endpoint once per process and rewrite the text file.
+    """
+    if METRICS_PORT:
+        _metrics_server(METRICS_PORT)
+    if METRICS_FILE:
+        METRICS.write_textfile(METRICS_FILE)
+
+
+def _render_resources():
+    # Imported here so the EVDS client stays out of app.py's startup imports
+    from data.fetchers.tcmb import get_client, memory_report
+
+    report = memory_report()
+    st.metric("Cache memory", f"{report['bytes'].sum() / 2**20:.1f} MiB")
+    st.dataframe(report.groupby("cache", as_index=False)[["bytes"]].sum(), hide_index=True)
+    if st.checkbox("Per series"):
+        st.dataframe(report, hide_index=True)
+
+    # Requests far above connections means keep-alive reuse is working
+    pools = get_client().pool_stats()
+    if pools:
+        st.dataframe(pd.DataFrame.from_dict(pools, orient="index").rename_axis("pool").reset_index(), hide_index=True)
+
+
+def render_debug_panel():
+    """
+    Sidebar panel with request, decode, cache and page timings recorded in this process,
+    the memory held by its caches and its EVDS connection pools.
+    """
+    with st.sidebar.expander("🐞 Debug Metrics", expanded=True):
+        _render_resources()
+
+        summary = METRICS.summary()
+        if summary.empty:
+            st.caption("No metrics recorded yet.")
+            return
+
+        counters = METRICS.counters()
+        hits = sum(v for (name, labels), v in counters.items() if name == "indicator_cache_requests_total" and ("result", "hit") in labels)
+        misses = sum(v for (name, labels), v in counters.items() if name == "indicator_cache_requests_total" and ("result", "miss") in labels)
+        coalesced = sum(v for (name, labels), v in counters.items() if name == "coalesced_requests_total")
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Cache hits", int(hits))
+        col2.metric("Cache misses", int(misses))
+        col3.metric("Coalesced", int(coalesced))
+
+        metric = st.selectbox("Metric", summary["metric"].unique())
+        rows = summary[summary["metric"] == metric]
+        st.dataframe(rows.drop(columns="metric"), hide_index=True)
+
+        label = st.selectbox("Labels", rows["labels"])
+        for (name, labels), hist in METRICS.histograms().items():
+            if name == metric and format_labels(labels) == label:
+                bounds = [f"≤{b:g}" for b in hist.buckets] + ["+Inf"]
+                st.bar_chart(pd.DataFrame({"bucket": bounds, "count": hist.counts}), x="bucket", y="count")
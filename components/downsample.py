@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from config.settings import CHART_WIDTH_PX
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: indices of `threshold` points that keep the visual shape of y(x).
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = y.astype(np.float64)
+    every = (n - 2) / (threshold - 2)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = int(i * every) + 1, int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+    return indices
+
+
+def minmax(y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Indices of the min and max of y in each of threshold / 2 equal buckets, plus both ends.
+    Keeps every spike, at the cost of a jagged look on smooth series.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 4:
+        return np.arange(n)
+
+    buckets = np.array_split(np.arange(n), threshold // 2)
+    indices = [0, n - 1]
+    for bucket in buckets:
+        values = y[bucket]
+        indices += [bucket[np.argmin(values)], bucket[np.argmax(values)]]
+    return np.unique(indices)
+
+
+def chart_points(width_fraction: float = 1.0):
+    """
+    Points worth sending for a chart spanning width_fraction of the page, or None when
+    full resolution is switched on in the sidebar.
+    """
+    if st.session_state.get("full_resolution"):
+        return None
+    return int(CHART_WIDTH_PX * width_fraction)
+
+
+def downsample(df: pd.DataFrame, columns: list, points: int, method: str = "lttb", by: str = None) -> pd.DataFrame:
+    """
+    Rows of a frame with a Date column worth charting at `points` pixels: the union of the rows
+    each column's downsampling keeps. With `by`, every group (one chart trace in a long frame)
+    is downsampled on its own. points=None returns the frame unchanged.
+    """
+    if points is None or len(df) <= points or "Date" not in df.columns:
+        return df
+    if by is not None:
+        return pd.concat([downsample(group, columns, points, method) for _, group in df.groupby(by, sort=False)])
+
+    x = df["Date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+    keep = np.zeros(len(df), dtype=bool)
+    for column in columns:
+        y = df[column].to_numpy(dtype=np.float64)
+        valid = np.flatnonzero(~np.isnan(y))
+        if method == "minmax":
+            chosen = minmax(y[valid], points)
+        else:
+            chosen = lttb(x[valid], y[valid], points)
+        keep[valid[chosen]] = True
+    return df[keep]
@@ -0,0 +1,86 @@
+import streamlit as st
+import plotly.express as px
+from datetime import datetime, timedelta
+from data.fetchers.registry import FX_CURRENCIES, FX_MA_WINDOW, FX_VOL_WINDOW, INDICATORS, fx_column, fx_ma_column, fx_vol_column
+from data.fetchers.tcmb import get_client
+from components.downsample import chart_points, downsample
+
+RATE_LABELS = {
+    "buying": "Forex Buying",
+    "selling": "Forex Selling",
+    "effective_buying": "Effective Buying",
+    "effective_selling": "Effective Selling",
+}
+
+@st.fragment
+def _fx_section():
+    """
+    Date range, fetch and FX chart; changing the dates or the selection reruns only this fragment.
+    Only the selected currencies and rate type are loaded; series already loaded are not refetched.
+    """
+    col1, col2 = st.columns(2)
+    with col1:
+        start_date = st.date_input("Start Date", datetime.now() - timedelta(days=30))
+    with col2:
+        end_date = st.date_input("End Date", datetime.now())
+
+    if st.button("Fetch Data"):
+        st.session_state["fx_range"] = (start_date.strftime("%d-%m-%Y"), end_date.strftime("%d-%m-%Y"))
+
+    if "fx_range" not in st.session_state:
+        return
+    start_str, end_str = st.session_state["fx_range"]
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        currencies = st.multiselect("Currencies", FX_CURRENCIES, default=["USD", "EUR"])
+    with col2:
+        rate = st.selectbox("Rate", list(RATE_LABELS), format_func=RATE_LABELS.get)
+
+    available = {spec.column for spec in INDICATORS["fx"].series}
+    names = {fx_column(currency, rate): currency for currency in currencies}
+    quoted = [column for column in names if column in available]
+    if not quoted:
+        st.info(f"TCMB does not quote {RATE_LABELS[rate].lower()} rates for the selected currencies.")
+        return
+
+    client = get_client()
+    with st.spinner("Fetching data from TCMB..."):
+        panel = client.get_fx_panel(start_str, end_str, quoted)
+
+    if panel.empty:
+        st.warning("No data found or API key missing.")
+        return
+
+    quoted = [column for column in quoted if column in panel.columns]
+    st.success(f"Fetched {len(panel)} records for {len(quoted)} series")
+
+    show_ma = st.checkbox(f"Overlay {FX_MA_WINDOW}-day moving averages")
+    averages = {fx_ma_column(c): f"{names[c]} MA{FX_MA_WINDOW}" for c in quoted if show_ma and fx_ma_column(c) in panel.columns}
+    df = panel.project(quoted + list(averages))
+
+    df_chart = df.ffill().rename(columns={**names, **averages})
+
+    lines = [names[c] for c in quoted] + list(averages.values())
+    melted_df = df_chart.melt(id_vars=["Date"], value_vars=lines, var_name="Currency", value_name="Rate")
+    melted_df = downsample(melted_df, ["Rate"], chart_points(), by="Currency")
+    title = " & ".join(names[c] for c in quoted) + f" / TRY {RATE_LABELS[rate]} Rates"
+    fig = px.line(melted_df, x="Date", y="Rate", color="Currency", title=title)
+    st.plotly_chart(fig, use_container_width=True)
+
+    volatility = {fx_vol_column(c): names[c] for c in quoted if fx_vol_column(c) in panel.columns}
+    if volatility:
+        # Weekend and holiday rows have no observation, so no volatility either
+        df_vol = panel.project(list(volatility)).dropna(how="all", subset=list(volatility)).rename(columns=volatility)
+        melted_vol = df_vol.melt(id_vars=["Date"], value_vars=list(volatility.values()), var_name="Currency", value_name="Volatility")
+        melted_vol = downsample(melted_vol, ["Volatility"], chart_points(), by="Currency")
+        fig_vol = px.line(melted_vol, x="Date", y="Volatility", color="Currency", title=f"{FX_VOL_WINDOW}-Day Annualized Volatility (%)")
+        st.plotly_chart(fig_vol, use_container_width=True)
+
+    with st.expander("View Raw Data"):
+        st.dataframe(df)
+
+def render_exchange_page():
+    st.write("### 💱 Exchange Rates (TCMB)")
+
+    _fx_section()
@@ -1,13 +1,14 @@
 import streamlit as st
-import plotly.express as px
 import plotly.graph_objects as go
-from data.fetchers.tcmb import TCMBClient
+from data.fetchers.tcmb import get_client
 from datetime import datetime, timedelta
+from components.view_models import ViewSpec, cached_view
 
-def render_inflation_page():
-    st.header("INF 💰 Inflation Deep-Dive")
-    st.markdown("Analysis of Consumer Price Index (CPI) trends using official TÜİK data via TCMB.")
+INFLATION_VIEW = ViewSpec(("CPI_Annual", "CPI_Monthly"))
 
+# Widget changes here rerun this section only, not the whole app script
+@st.fragment
+def _inflation_section():
     col1, col2 = st.columns(2)
     with col1:
         start_date = st.date_input("Start Date", datetime.now() - timedelta(days=730))
@@ -15,7 +16,7 @@ def render_inflation_page():
         end_date = st.date_input("End Date", datetime.now())
 
     if st.button("Fetch Inflation Data"):
-        client = TCMBClient()
+        client = get_client()
         start_str = start_date.strftime("%d-%m-%Y")
         end_str = end_date.strftime("%d-%m-%Y")
 
@@ -25,25 +26,25 @@ def render_inflation_page():
         if not df.empty:
             st.success(f"Loaded {len(df)} months of data")
             
-            latest = df.iloc[-1]
-            prev = df.iloc[-2] if len(df) > 1 else latest
+            view = cached_view(df, INFLATION_VIEW)
+            yoy, mom = view.metrics['CPI_Annual'], view.metrics['CPI_Monthly']
             
             c1, c2 = st.columns(2)
-            c1.metric("Annual Inflation (YoY)", f"{latest['CPI_Annual']:.2f}%", f"{latest['CPI_Annual'] - prev['CPI_Annual']:.2f}%", delta_color="inverse")
-            c2.metric("Monthly Inflation (MoM)", f"{latest['CPI_Monthly']:.2f}%", f"{latest['CPI_Monthly'] - prev['CPI_Monthly']:.2f}%", delta_color="inverse")
+            c1.metric("Annual Inflation (YoY)", f"{yoy.value:.2f}%", f"{yoy.delta:.2f}%", delta_color="inverse")
+            c2.metric("Monthly Inflation (MoM)", f"{mom.value:.2f}%", f"{mom.delta:.2f}%", delta_color="inverse")
 
             fig = go.Figure()
             
             fig.add_trace(go.Bar(
-                x=df['Date'],
-                y=df['CPI_Annual'],
+                x=view.charts['CPI_Annual']['Date'],
+                y=view.charts['CPI_Annual']['CPI_Annual'],
                 name='Annual (YoY)',
                 marker_color='#E30A17'
             ))
             
             fig.add_trace(go.Scatter(
-                x=df['Date'],
-                y=df['CPI_Monthly'],
+                x=view.charts['CPI_Monthly']['Date'],
+                y=view.charts['CPI_Monthly']['CPI_Monthly'],
                 name='Monthly (MoM)',
                 yaxis='y2',
                 line=dict(color='#1E3A5F', width=3)
@@ -64,3 +65,9 @@ def render_inflation_page():
         
         else:
             st.warning("No data found. Check your API key and date range.")
+
+def render_inflation_page():
+    st.header("INF 💰 Inflation Deep-Dive")
+    st.markdown("Analysis of Consumer Price Index (CPI) trends using official TÜİK data via TCMB.")
+
+    _inflation_section()
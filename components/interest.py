@@ -1,12 +1,15 @@
 import streamlit as st
 import plotly.graph_objects as go
-from data.fetchers.tcmb import TCMBClient
+from data.fetchers.tcmb import get_client
 from datetime import datetime, timedelta
+from components.view_models import ViewSpec, cached_view
+from data.fetchers.derived import real_policy_rate
 
-def render_interest_page():
-    st.header("INT 📈 Interest Rates & Monetary Policy")
-    st.markdown("Tracking the Central Bank of the Republic of Turkey (TCMB) Policy Rate (One-Week Repo Auction Rate).")
+INTEREST_VIEW = ViewSpec(("Policy_Rate",), delta="last_change")
+REAL_RATE_VIEW = ViewSpec(("Real_Policy_Rate",), delta="last_change")
 
+@st.fragment
+def _policy_rate_section():
     col1, col2 = st.columns(2)
     with col1:
         start_date = st.date_input("Start Date", datetime.now() - timedelta(days=730))
@@ -14,41 +17,46 @@ def render_interest_page():
         end_date = st.date_input("End Date", datetime.now())
 
     if st.button("Fetch Interest Rates"):
-        client = TCMBClient()
+        client = get_client()
         start_str = start_date.strftime("%d-%m-%Y")
         end_str = end_date.strftime("%d-%m-%Y")
 
         with st.spinner("Fetching policy rate data..."):
             df = client.get_interest_rates(start_str, end_str)
+            df_real = real_policy_rate(df, client.get_cpi_data(start_str, end_str))
 
         if not df.empty:
             st.success(f"Loaded policy rate history")
             
-            latest = df.iloc[-1]
-            
-            current_rate = latest['Policy_Rate']
-            
-            prev_rate = current_rate
-            for rate in df['Policy_Rate'].iloc[::-1]:
-                 if rate != current_rate:
-                     prev_rate = rate
-                     break
-            
-            delta = current_rate - prev_rate
+            view = cached_view(df, INTEREST_VIEW)
+            rate = view.metrics['Policy_Rate']
             
             c1, c2 = st.columns(2)
-            c1.metric("Policy Rate", f"{current_rate:.2f}%", f"{delta:.2f}%", delta_color="inverse")
+            c1.metric("Policy Rate", f"{rate.value:.2f}%", f"{rate.delta:.2f}%", delta_color="inverse")
+            real_view = cached_view(df_real, REAL_RATE_VIEW)
+            if 'Real_Policy_Rate' in real_view.metrics:
+                real = real_view.metrics['Real_Policy_Rate']
+                c2.metric("Real Policy Rate", f"{real.value:.2f}%", f"{real.delta:.2f}%", help="Policy rate minus the latest annual CPI inflation")
             
             fig = go.Figure()
             
             fig.add_trace(go.Scatter(
-                x=df['Date'],
-                y=df['Policy_Rate'],
+                x=view.charts['Policy_Rate']['Date'],
+                y=view.charts['Policy_Rate']['Policy_Rate'],
                 mode='lines',
                 name='Policy Rate',
                 line=dict(color='#1E3A5F', width=3, shape='hv')
             ))
             
+            if 'Real_Policy_Rate' in real_view.charts:
+                fig.add_trace(go.Scatter(
+                    x=real_view.charts['Real_Policy_Rate']['Date'],
+                    y=real_view.charts['Real_Policy_Rate']['Real_Policy_Rate'],
+                    mode='lines',
+                    name='Real Policy Rate',
+                    line=dict(color='#E67E22', width=2, dash='dot', shape='hv')
+                ))
+            
             fig.update_layout(
                 title="TCMB One-Week Repo Auction Rate",
                 yaxis=dict(title="Rate (%)"),
@@ -62,3 +70,9 @@ def render_interest_page():
         
         else:
             st.warning("No data found. Check your API key and date range.")
+
+def render_interest_page():
+    st.header("INT 📈 Interest Rates & Monetary Policy")
+    st.markdown("Tracking the Central Bank of the Republic of Turkey (TCMB) Policy Rate (One-Week Repo Auction Rate).")
+
+    _policy_rate_section()
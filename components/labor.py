@@ -1,14 +1,34 @@
 import streamlit as st
 import altair as alt
+import pandas as pd
 from datetime import datetime, timedelta
-from data.fetchers.tcmb import TCMBClient
+from data.fetchers.tcmb import get_client
 from components.cards import render_metric_card
+from components.view_models import ViewSpec, cached_view
+
+LABOR_VIEW = ViewSpec(("Unemployment_Rate", "Participation_Rate"))
+
+TREND_PERIODS = {"1Y": 1, "3Y": 3, "5Y": 5}
+
+@st.fragment
+def _render_trend(df, column, title, color):
+    """
+    One tab's chart with its own period selector; picking a period reruns only this tab.
+    """
+    period = st.radio("Period", list(TREND_PERIODS), index=len(TREND_PERIODS) - 1, horizontal=True, key=f"period_{column}")
+    chart_df = df[df["Date"] >= df["Date"].max() - pd.DateOffset(years=TREND_PERIODS[period])]
+    chart = alt.Chart(chart_df).mark_line(color=color).encode(
+        x=alt.X('Date', title='Date', axis=alt.Axis(format='%Y')),
+        y=alt.Y(column, title=title, scale=alt.Scale(zero=False)),
+        tooltip=[alt.Tooltip('Date', format='%Y-%m'), alt.Tooltip(column, format='.1f')]
+    ).properties(height=350)
+    st.altair_chart(chart, use_container_width=True)
 
 def show_labor():
     st.markdown("## 👷 Labor Market")
     st.markdown("Unemployment and labor force participation indicators.")
     
-    client = TCMBClient()
+    client = get_client()
     
     end_date = datetime.now()
     start_date = end_date - timedelta(days=365*5)
@@ -23,31 +43,25 @@ def show_labor():
         st.error("No Labor Market data available. Please check API connection.")
         return
         
-    latest = df.iloc[-1]
-    
-    unemp_curr = latest["Unemployment_Rate"]
-    unemp_prev = df.iloc[-2]["Unemployment_Rate"] if len(df) > 1 else unemp_curr
-    unemp_delta = unemp_curr - unemp_prev
-    
-    part_curr = latest["Participation_Rate"]
-    part_prev = df.iloc[-2]["Participation_Rate"] if len(df) > 1 else part_curr
-    part_delta = part_curr - part_prev
+    view = cached_view(df, LABOR_VIEW)
+    unemp = view.metrics["Unemployment_Rate"]
+    part = view.metrics["Participation_Rate"]
     
     col1, col2 = st.columns(2)
     
     with col1:
         render_metric_card(
             "Unemployment Rate",
-            f"{unemp_curr:.1f}%",
-            f"{unemp_delta:+.1f}%",
+            f"{unemp.value:.1f}%",
+            f"{unemp.delta:+.1f}%",
             description="Seasonally Adjusted"
         )
         
     with col2:
          render_metric_card(
             "Participation Rate",
-            f"{part_curr:.1f}%",
-            f"{part_delta:+.1f}%",
+            f"{part.value:.1f}%",
+            f"{part.delta:+.1f}%",
             description="Labor Force Participation"
         )
         
@@ -58,20 +72,10 @@ def show_labor():
     tab1, tab2 = st.tabs(["Unemployment Rate", "Participation Rate"])
     
     with tab1:
-        chart_unemp = alt.Chart(df).mark_line(color="#E74C3C").encode(
-            x=alt.X('Date', title='Date', axis=alt.Axis(format='%Y')),
-            y=alt.Y('Unemployment_Rate', title='Unemployment Rate (%)', scale=alt.Scale(zero=False)),
-            tooltip=[alt.Tooltip('Date', format='%Y-%m'), alt.Tooltip('Unemployment_Rate', format='.1f')]
-        ).properties(height=350)
-        st.altair_chart(chart_unemp, use_container_width=True)
+        _render_trend(view.charts["Unemployment_Rate"], "Unemployment_Rate", "Unemployment Rate (%)", "#E74C3C")
         
     with tab2:
-        chart_part = alt.Chart(df).mark_line(color="#2ECC71").encode(
-            x=alt.X('Date', title='Date', axis=alt.Axis(format='%Y')),
-            y=alt.Y('Participation_Rate', title='Participation Rate (%)', scale=alt.Scale(zero=False)),
-            tooltip=[alt.Tooltip('Date', format='%Y-%m'), alt.Tooltip('Participation_Rate', format='.1f')]
-        ).properties(height=350)
-        st.altair_chart(chart_part, use_container_width=True)
+        _render_trend(view.charts["Participation_Rate"], "Participation_Rate", "Participation Rate (%)", "#2ECC71")
 
     with st.expander("View Raw Data"):
             st.dataframe(df.sort_values("Date", ascending=False))
@@ -1,14 +1,17 @@
 import streamlit as st
 import altair as alt
 from datetime import datetime, timedelta
-from data.fetchers.tcmb import TCMBClient
+from data.fetchers.tcmb import get_client
 from components.cards import render_metric_card
+from components.view_models import ViewSpec, cached_view
+
+PRODUCTION_VIEW = ViewSpec(("Capacity_Utilization",))
 
 def show_production():
     st.markdown("## 🏭 Production & Real Sector")
     st.markdown("Monitoring industrial activity and capacity utilization.")
     
-    client = TCMBClient()
+    client = get_client()
     
     end_date = datetime.now()
     start_date = end_date - timedelta(days=365*5)
@@ -23,26 +26,23 @@ def show_production():
         st.error("No Production data available. Please check API connection.")
         return
         
-    latest = df.iloc[-1]
-    
-    cap_curr = latest["Capacity_Utilization"]
-    cap_prev = df.iloc[-2]["Capacity_Utilization"] if len(df) > 1 else cap_curr
-    cap_delta = cap_curr - cap_prev
+    view = cached_view(df, PRODUCTION_VIEW)
+    cap = view.metrics["Capacity_Utilization"]
     
     col1, col2 = st.columns([1, 3])
     
     with col1:
         render_metric_card(
             "Capacity Utilization",
-            f"{cap_curr:.1f}%",
-            f"{cap_delta:+.1f}%",
+            f"{cap.value:.1f}%",
+            f"{cap.delta:+.1f}%",
             description="Manufacturing Industry"
         )
         st.info("The Capacity Utilization Rate (CUR) measures the extent to which the installed productive capacity is being used.")
         
     with col2:
         st.markdown("#### Historical Trend (5 Years)")
-        chart = alt.Chart(df).mark_line(color="#2980B9").encode(
+        chart = alt.Chart(view.charts["Capacity_Utilization"]).mark_line(color="#2980B9").encode(
             x=alt.X('Date', title='Date', axis=alt.Axis(format='%Y')),
             y=alt.Y('Capacity_Utilization', title='Utilization Rate (%)', scale=alt.Scale(domain=[60, 90])),
             tooltip=[alt.Tooltip('Date', format='%Y-%m'), alt.Tooltip('Capacity_Utilization', format='.1f')]
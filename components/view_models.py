@@ -0,0 +1,102 @@
+from dataclasses import dataclass, field
+import numpy as np
+import pandas as pd
+import streamlit as st
+from config.settings import CACHE_TTL
+from components.downsample import downsample
+
+
+@dataclass(frozen=True)
+class MetricView:
+    """
+    Latest value of a series and its change against the comparison point.
+    """
+    value: float
+    delta: float
+
+
+@dataclass(frozen=True)
+class ViewSpec:
+    """
+    How a page displays an indicator.
+
+    columns: series shown as metrics and charts.
+    delta: "previous" compares with the previous row, "last_change" with the last different value
+        (for step series like the policy rate).
+    ffill: forward-fill gaps (weekends, holidays) before taking values and charting.
+    downsample: reduce the chart slice to the requested number of points.
+    """
+    columns: tuple
+    delta: str = "previous"
+    ffill: bool = False
+    downsample: bool = False
+
+
+@dataclass(frozen=True)
+class IndicatorView:
+    """
+    Display-ready data for one indicator: {column: MetricView} and {column: chart frame}.
+    A column without valid observations has no metric.
+    """
+    metrics: dict = field(default_factory=dict)
+    charts: dict = field(default_factory=dict)
+
+    @property
+    def empty(self) -> bool:
+        return not self.charts
+
+
+def _metric(values: np.ndarray, delta: str) -> MetricView:
+    current = values[-1]
+    previous = values[-2] if len(values) > 1 else current
+    if delta == "last_change":
+        previous = current
+        changed = values[values != current]
+        if len(changed):
+            previous = changed[-1]
+    return MetricView(float(current), float(current - previous))
+
+
+def build_view(df: pd.DataFrame, spec: ViewSpec, chart_start: pd.Timestamp = None, points: int = None) -> IndicatorView:
+    """
+    Metrics over the whole frame and per-column chart slices from chart_start on.
+    """
+    if df.empty or "Date" not in df.columns:
+        return IndicatorView()
+
+    columns = [c for c in spec.columns if c in df.columns]
+    frame = df[["Date"] + columns]
+    if spec.ffill:
+        frame = frame.ffill()
+
+    metrics, charts = {}, {}
+    for column in columns:
+        values = frame[column].to_numpy()
+        if spec.ffill:
+            values = values[~np.isnan(values)]
+        if len(values):
+            metrics[column] = _metric(values, spec.delta)
+
+    if chart_start is not None:
+        frame = frame[frame["Date"] >= chart_start]
+    for column in columns:
+        chart = frame[["Date", column]]
+        charts[column] = downsample(chart, [column], points) if spec.downsample else chart
+    return IndicatorView(metrics, charts)
+
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=64)
+def cached_view(df: pd.DataFrame, spec: ViewSpec, chart_start: pd.Timestamp = None, points: int = None) -> IndicatorView:
+    """
+    build_view memoized on the frame's content, so reruns over the same data version reuse it.
+    """
+    return build_view(df, spec, chart_start, points)
+
+
+def chart_start_for(days_back: int, now: pd.Timestamp = None) -> pd.Timestamp:
+    """
+    First chart date for a window of the last days_back days. Rounded up to midnight so the
+    value stays the same across reruns within a day and keeps hitting the memoized view.
+    """
+    now = pd.Timestamp.now() if now is None else now
+    return (now - pd.Timedelta(days=days_back)).ceil("D")
@@ -9,6 +9,9 @@ LAYOUT = "wide"
 
 TCMB_API_KEY = os.getenv("TCMB_API_KEY")
 
+# Point at a local stand-in (see tools/mock_evds) to run without network access
+TCMB_BASE_URL = os.getenv("TCMB_BASE_URL", "https://evds3.tcmb.gov.tr/igmevdsms-dis")
+
 COLORS = {
     "primary": "#E30A17",
     "secondary": "#FFFFFF",
@@ -19,3 +22,45 @@ COLORS = {
     "background": "#F8F9FA",
     "card": "#FFFFFF",
 }
+
+# Seconds fetched data is served before the live edge of a series is refreshed
+CACHE_TTL = 3600
+
+# On-disk EVDS series store used for incremental fetching. Set to an empty value to disable.
+SERIES_STORE_PATH = os.getenv(
+    "SERIES_STORE_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "store", "evds.sqlite"),
+)
+
+# Days re-requested before the last stored observation to pick up revisions
+REVISION_WINDOW_DAYS = {1: 7, 5: 93}
+
+# Long ranges are requested as consecutive date windows of at most this many days per frequency,
+# up to FETCH_CHUNK_WORKERS at a time over the pooled session
+FETCH_CHUNK_DAYS = {1: 1826, 5: 7305}
+FETCH_CHUNK_WORKERS = int(os.getenv("FETCH_CHUNK_WORKERS", "4"))
+
+# Frame cache shared by every dashboard process: redis://host:6379/0, sqlite:///path/to/cache.sqlite
+# (or a plain file path). Empty keeps caching per process.
+SHARED_CACHE_URL = os.getenv("SHARED_CACHE_URL", "")
+
+# Upstream resilience: attempts per request, and consecutive failures before the circuit opens
+RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "3"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("BREAKER_RESET_SECONDS", "60"))
+
+# Client-side token bucket for the shared EVDS key: requests per second and burst size (0 disables).
+# With EVDS_RATE_LIMIT_PATH every process on the host draws from one bucket kept in that SQLite file.
+EVDS_RATE_LIMIT = float(os.getenv("EVDS_RATE_LIMIT", "5"))
+EVDS_RATE_BURST = int(os.getenv("EVDS_RATE_BURST", "10"))
+EVDS_RATE_LIMIT_PATH = os.getenv("EVDS_RATE_LIMIT_PATH", "")
+
+# Connections kept alive per EVDS host by the shared client's pool
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+
+# Prometheus text metrics: a file rewritten after every page run and/or a /metrics HTTP port. Empty disables.
+METRICS_FILE = os.getenv("METRICS_FILE", "")
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
+
+# Chart width in pixels that long series are downsampled to before charting (about one point per pixel)
+CHART_WIDTH_PX = int(os.getenv("CHART_WIDTH_PX", "1200"))
@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import pandas as pd
+
+DATE_FMT = "%d-%m-%Y"
+
+
+@dataclass
+class SeriesRequest:
+    """
+    The EVDS series one indicator needs over one date window.
+    """
+    name: str
+    codes: list
+    frequency: int
+    start: datetime
+    end: datetime
+
+
+@dataclass
+class Batch:
+    """
+    A single upstream EVDS call covering several indicators.
+    The window is the union of the member windows; members slice their own range back out.
+    """
+    frequency: int
+    start: datetime
+    end: datetime
+    requests: list = field(default_factory=list)
+
+    @property
+    def codes(self) -> list:
+        codes = []
+        for req in self.requests:
+            for code in req.codes:
+                if code not in codes:
+                    codes.append(code)
+        return codes
+
+    @property
+    def start_str(self) -> str:
+        return self.start.strftime(DATE_FMT)
+
+    @property
+    def end_str(self) -> str:
+        return self.end.strftime(DATE_FMT)
+
+
+def plan_batches(requests: list) -> list:
+    """
+    Group series requests by frequency and merge overlapping date windows,
+    so every group becomes one EVDS call with a dash-joined series list.
+    """
+    by_frequency = {}
+    for req in requests:
+        by_frequency.setdefault(req.frequency, []).append(req)
+
+    batches = []
+    for frequency, reqs in by_frequency.items():
+        current = None
+        for req in sorted(reqs, key=lambda r: r.start):
+            if current is not None and req.start <= current.end:
+                current.end = max(current.end, req.end)
+                current.requests.append(req)
+            else:
+                current = Batch(frequency, req.start, req.end, [req])
+                batches.append(current)
+    return batches
+
+
+def split_window(start: datetime, end: datetime, days: int, monthly: bool = False) -> list:
+    """
+    Cut [start, end] into consecutive (start, end) windows of at most `days` days, in date order.
+    Monthly windows begin on the first of a month, so no observation straddles two windows.
+    """
+    windows = []
+    cursor = start
+    while cursor <= end:
+        following = cursor + timedelta(days=days)
+        if monthly:
+            following = following.replace(day=1)
+            if following <= cursor:
+                following = (cursor.replace(day=1) + timedelta(days=32)).replace(day=1)
+        stop = min(following - timedelta(days=1), end)
+        windows.append((cursor, stop))
+        cursor = stop + timedelta(days=1)
+    return windows
+
+
+def split_batch(batch: Batch, df: pd.DataFrame) -> dict:
+    """
+    Split a combined decoded frame back into one raw frame per indicator,
+    keeping only the Date column and that indicator's series columns.
+    """
+    parts = {}
+    if "Date" not in df.columns:
+        return parts
+    for req in batch.requests:
+        cols = [code.replace(".", "_") for code in req.codes]
+        parts[req.name] = df[["Date"] + [c for c in cols if c in df.columns]]
+    return parts
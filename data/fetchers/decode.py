@@ -0,0 +1,91 @@
+import json
+import numpy as np
+import pandas as pd
+from data.fetchers.registry import SERIES_BY_CODE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# EVDS UNIXTIME values are local midnights in Turkey
+EVDS_TZ = "Europe/Istanbul"
+
+# Tarih formats EVDS uses: daily "17-10-2026", monthly "2026-10" (month may not be zero padded)
+TARIH_FORMATS = ["%d-%m-%Y", "%Y-%m", "%Y-%m-%d"]
+
+
+def parse_tarih(tarih: pd.Series) -> pd.Series:
+    """
+    Parse an EVDS Tarih column, trying each known format until every value parses.
+    """
+    for fmt in TARIH_FORMATS:
+        parsed = pd.to_datetime(tarih, format=fmt, errors="coerce")
+        if not parsed.isna().any():
+            return parsed
+    return pd.to_datetime(tarih, errors="coerce")
+
+
+def loads(content: bytes):
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _unixtime_dates(items: list):
+    """
+    Dates from the UNIXTIME field, or None if any item lacks it.
+    """
+    seconds = []
+    for item in items:
+        stamp = item.get("UNIXTIME")
+        if isinstance(stamp, dict):
+            stamp = stamp.get("$numberLong")
+        if stamp is None:
+            return None
+        seconds.append(stamp)
+    try:
+        seconds = np.array(seconds, dtype=np.int64)
+    except (TypeError, ValueError):
+        return None
+    stamps = pd.to_datetime(seconds, unit="s", utc=True).tz_convert(EVDS_TZ)
+    # Round rather than floor, so a timestamp a few hours off local midnight still lands on its day
+    return stamps.tz_localize(None).round("D")
+
+
+def _float_column(values: list) -> np.ndarray:
+    """
+    EVDS sends numbers as strings and gaps as null; parse straight into float64.
+    """
+    try:
+        return np.array(["nan" if v is None else v for v in values], dtype=np.float64)
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+
+
+def decode_items(content: bytes, codes: list) -> pd.DataFrame:
+    """
+    Decode an EVDS JSON response straight into typed columns: a datetime64 Date column plus
+    one float64 column per requested series code. Tarih, UNIXTIME and any other raw fields
+    are dropped, and no object-dtype frame of dicts is built along the way.
+    """
+    data = loads(content)
+    items = data.get("items") if isinstance(data, dict) else None
+    if not items:
+        return pd.DataFrame()
+
+    dates = _unixtime_dates(items)
+    if dates is None:
+        tarih = pd.Series([item.get("Tarih") for item in items], dtype=object)
+        spec = SERIES_BY_CODE.get(codes[0]) if codes else None
+        dates = pd.to_datetime(tarih, format=spec.date_format, errors="coerce") if spec else None
+        if dates is None or dates.isna().any():
+            dates = parse_tarih(tarih)
+        dates = pd.DatetimeIndex(dates)
+
+    columns = {"Date": np.asarray(dates, dtype="datetime64[ns]")}
+    for code in codes:
+        col = code.replace(".", "_")
+        if any(col in item for item in items):
+            columns[col] = _float_column([item.get(col) for item in items])
+    return pd.DataFrame(columns)
@@ -0,0 +1,105 @@
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Trading days per year, for annualizing daily volatility
+TRADING_DAYS = 252
+
+
+@dataclass(frozen=True)
+class Derived:
+    """
+    A column derived from one source column of an indicator frame.
+
+    kind: "pct_change" (% change over `window` observations), "moving_average",
+        or "volatility" (annualized % standard deviation of daily log returns over `window` returns).
+    Windows count observations, so weekend and holiday rows without data are skipped.
+    """
+    column: str
+    source: str
+    kind: str
+    window: int
+
+
+def pct_change(values: np.ndarray, window: int) -> np.ndarray:
+    out = np.full_like(values, np.nan)
+    if len(values) > window:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[window:] = (values[window:] / values[:-window] - 1) * 100
+    return out
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    out = np.full_like(values, np.nan)
+    if len(values) >= window:
+        out[window - 1:] = sliding_window_view(values, window, axis=0).mean(axis=-1)
+    return out
+
+
+def volatility(values: np.ndarray, window: int) -> np.ndarray:
+    out = np.full_like(values, np.nan)
+    if len(values) > window:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = np.diff(np.log(values), axis=0)
+        out[window:] = sliding_window_view(returns, window, axis=0).std(axis=-1, ddof=1) * np.sqrt(TRADING_DAYS) * 100
+    return out
+
+
+KERNELS = {
+    "pct_change": pct_change,
+    "moving_average": moving_average,
+    "volatility": volatility,
+}
+
+
+def compute(values: np.ndarray, derived: list, sources: list) -> np.ndarray:
+    """
+    All derived columns for a (rows, sources) matrix, one kernel call per (kind, window) over every
+    source it applies to at once. Rows where every source is missing are skipped and stay NaN.
+    """
+    out = np.full((len(values), len(derived)), np.nan)
+    rows = np.flatnonzero(~np.isnan(values).all(axis=1))
+    observed = values[rows]
+
+    groups = {}
+    for j, d in enumerate(derived):
+        groups.setdefault((d.kind, d.window), []).append(j)
+    for (kind, window), targets in groups.items():
+        cols = [sources.index(derived[j].source) for j in targets]
+        out[np.ix_(rows, targets)] = KERNELS[kind](observed[:, cols], window)
+    return out
+
+
+def apply_derived(df: pd.DataFrame, derived: tuple) -> pd.DataFrame:
+    """
+    df plus the derived columns whose source column it has, computed in one vectorized pass
+    and cast to their source's dtype.
+    """
+    derived = [d for d in derived if d.source in df.columns]
+    if not derived or df.empty:
+        return df
+    sources = list(dict.fromkeys(d.source for d in derived))
+    out = compute(df[sources].to_numpy(dtype=np.float64), derived, sources)
+    return df.assign(**{d.column: out[:, j].astype(df[d.source].dtype) for j, d in enumerate(derived)})
+
+
+def real_policy_rate(interest: pd.DataFrame, cpi: pd.DataFrame) -> pd.DataFrame:
+    """
+    Policy_Rate minus the annual inflation of the latest CPI month on or before each date:
+    Date, Policy_Rate, CPI_Annual, Real_Policy_Rate.
+    """
+    cpi = cpi.dropna(subset=["CPI_Annual"]) if "CPI_Annual" in cpi.columns else pd.DataFrame()
+    if interest.empty or cpi.empty:
+        return pd.DataFrame(columns=["Date", "Policy_Rate", "CPI_Annual", "Real_Policy_Rate"])
+    cpi_dates = cpi["Date"].to_numpy(dtype="datetime64[ns]")
+    dates = interest["Date"].to_numpy(dtype="datetime64[ns]")
+    idx = np.searchsorted(cpi_dates, dates, side="right") - 1
+    inflation = np.where(idx >= 0, cpi["CPI_Annual"].to_numpy(dtype=np.float64)[np.maximum(idx, 0)], np.nan)
+    rate = interest["Policy_Rate"].to_numpy(dtype=np.float64)
+    return pd.DataFrame({
+        "Date": interest["Date"].to_numpy(),
+        "Policy_Rate": rate,
+        "CPI_Annual": inflation,
+        "Real_Policy_Rate": rate - inflation,
+    })
@@ -0,0 +1,177 @@
+import threading
+import time
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+from data.fetchers.registry import SERIES_BY_CODE
+
+ONE_DAY = timedelta(days=1)
+
+def merge_spans(spans: list) -> list:
+    """
+    Merge overlapping or adjacent (start, end) date spans into a sorted, disjoint list.
+    """
+    merged = []
+    for start, end in sorted(spans):
+        if merged and start <= merged[-1][1] + ONE_DAY:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_spans(spans: list, start: datetime, end: datetime) -> list:
+    """
+    Parts of [start, end] not covered by any of the given spans.
+    """
+    gaps = []
+    cursor = start
+    for span_start, span_end in merge_spans(spans):
+        if span_end < cursor:
+            continue
+        if span_start > end:
+            break
+        if span_start > cursor:
+            gaps.append((cursor, span_start - ONE_DAY))
+        cursor = max(cursor, span_end + ONE_DAY)
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def group_by_gaps(gaps_by_code: dict) -> list:
+    """
+    Group series codes that are missing exactly the same spans, so each group can share
+    one upstream request per span. Returns [(codes, gaps)].
+    """
+    groups = {}
+    for code, gaps in gaps_by_code.items():
+        if gaps:
+            groups.setdefault(tuple(gaps), []).append(code)
+    return [(codes, list(gaps)) for gaps, codes in groups.items()]
+
+
+def trusted_spans(spans: list, ttl: float, revision_days: int, now: float = None) -> list:
+    """
+    Turn (start, end, fetched_at) spans into the (start, end) ranges that can still be served.
+    Once a span is older than the TTL, its last revision_days (counted from the fetch) may have
+    been revised or extended upstream, so that edge is treated as missing again.
+    """
+    now = time.time() if now is None else now
+    trusted = []
+    for start, end, fetched_at in spans:
+        if now - fetched_at >= ttl:
+            end = min(end, datetime.fromtimestamp(fetched_at) - timedelta(days=revision_days))
+        if end >= start:
+            trusted.append((start, end))
+    return trusted
+
+
+class IntervalCache:
+    """
+    In-memory, range-aware cache of raw EVDS observations.
+    Tracks which date spans are held per series, so any contained range is answered by slicing
+    and only the missing edges of a wider range have to be fetched.
+    """
+    def __init__(self, ttl: float = 3600, revision_days: dict = None):
+        self.ttl = ttl
+        self.revision_days = revision_days or {}
+        self._lock = threading.Lock()
+        self._spans = {}
+        self._data = {}
+
+    def missing(self, codes: list, frequency: int, start: datetime, end: datetime, stale_ok: bool = False) -> dict:
+        """
+        Date spans within [start, end] that are not held, per series code.
+        With stale_ok, spans past their TTL still count as held (for stale-while-revalidate).
+        """
+        revision = self.revision_days.get(frequency, 7)
+        ttl = float("inf") if stale_ok else self.ttl
+        with self._lock:
+            return {
+                code: missing_spans(trusted_spans(self._spans.get((code, frequency), []), ttl, revision), start, end)
+                for code in codes
+            }
+
+    def put(self, df: pd.DataFrame, codes: list, frequency: int, start: datetime, end: datetime, fetched_at: float = None):
+        """
+        Record a decoded raw frame as covering [start, end] for each of the codes.
+        Values are held as (sorted datetime64 dates, values in the series' registry dtype) arrays.
+        fetched_at defaults to now; pass 0 for data already past its TTL (e.g. an expired store span),
+        so it is served while stale but revalidated like any other expired span.
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        dates = df["Date"].to_numpy(dtype="datetime64[ns]") if "Date" in df.columns else None
+        with self._lock:
+            for code in codes:
+                key = (code, frequency)
+                col = code.replace(".", "_")
+                if dates is not None and col in df.columns:
+                    spec = SERIES_BY_CODE.get(code)
+                    values = df[col].to_numpy(dtype=spec.dtype if spec else "float64")
+                    held = self._data.get(key)
+                    if held is not None:
+                        keep = ~np.isin(held[0], dates)
+                        new_dates = np.concatenate([held[0][keep], dates])
+                        values = np.concatenate([held[1][keep], values])
+                    else:
+                        new_dates = dates
+                    order = np.argsort(new_dates, kind="stable")
+                    self._data[key] = (new_dates[order], values[order])
+                # Spans fully inside the new one carry nothing the new fetch doesn't
+                spans = [s for s in self._spans.get(key, []) if not (start <= s[0] and s[1] <= end)]
+                spans.append((start, end, fetched_at))
+                self._spans[key] = spans
+
+    def fresh_for(self, codes: list, frequency: int, start: datetime, end: datetime, now: float = None) -> float:
+        """
+        Seconds until held data for [start, end] needs revalidating, i.e. until a span expiry opens a
+        gap that newer spans do not cover: 0 when one already has, inf when none will.
+        Parts of the range that are not held at all do not count.
+        """
+        now = time.time() if now is None else now
+        revision = self.revision_days.get(frequency, 7)
+        with self._lock:
+            spans = [list(self._spans.get((code, frequency), [])) for code in codes]
+
+        def gaps(at: float, ttl: float) -> list:
+            return [missing_spans(trusted_spans(held, ttl, revision, now=at), start, end) for held in spans]
+
+        never_expired = gaps(now, float("inf"))
+        expiries = sorted({fetched_at + self.ttl for held in spans for _, _, fetched_at in held if fetched_at + self.ttl > now})
+        for at in [now] + expiries:
+            if gaps(at, self.ttl) != never_expired:
+                return at - now
+        return float("inf")
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+            self._data.clear()
+
+    def memory_usage(self) -> dict:
+        """
+        {(code, frequency): (rows, bytes)} for every series held.
+        """
+        with self._lock:
+            return {key: (len(dates), dates.nbytes + values.nbytes) for key, (dates, values) in self._data.items()}
+
+    def get(self, codes: list, frequency: int, start: datetime, end: datetime) -> pd.DataFrame:
+        """
+        Slice held observations for [start, end] into a wide raw frame: Date plus one column per code.
+        """
+        lo, hi = np.datetime64(start, "ns"), np.datetime64(end, "ns")
+        columns = {}
+        with self._lock:
+            for code in codes:
+                held = self._data.get((code, frequency))
+                if held is None:
+                    continue
+                dates, values = held
+                i, j = np.searchsorted(dates, lo, "left"), np.searchsorted(dates, hi, "right")
+                columns[code.replace(".", "_")] = pd.Series(values[i:j], index=dates[i:j])
+        if not columns:
+            return pd.DataFrame()
+        wide = pd.DataFrame(columns).sort_index()
+        wide.index.name = "Date"
+        return wide.reset_index()
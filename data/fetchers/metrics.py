@@ -0,0 +1,205 @@
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pandas as pd
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+BYTES_BUCKETS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+ROWS_BUCKETS = (10, 100, 1_000, 10_000, 100_000)
+
+# Histograms and counters recorded by the client and the app; bucket bounds and help text per metric
+HISTOGRAMS = {
+    "evds_request_seconds": (SECONDS_BUCKETS, "Upstream EVDS request latency, retries included."),
+    "evds_ratelimit_wait_seconds": (SECONDS_BUCKETS, "Time an EVDS request waited for a rate-limit token, by lane."),
+    "evds_response_bytes": (BYTES_BUCKETS, "EVDS response body size."),
+    "evds_response_rows": (ROWS_BUCKETS, "Observations per EVDS response."),
+    "evds_decode_seconds": (SECONDS_BUCKETS, "Time decoding an EVDS response into typed columns."),
+    "indicator_normalize_seconds": (SECONDS_BUCKETS, "Time normalizing and transforming an indicator."),
+    "page_render_seconds": (SECONDS_BUCKETS, "Script time per dashboard page."),
+}
+COUNTERS = {
+    "indicator_cache_requests_total": "st.cache_data lookups of indicator frames, by result (hit or miss).",
+    "evds_request_errors_total": "EVDS requests that failed after retries.",
+    "shared_cache_requests_total": "Shared cache lookups of indicator frames, by result (hit or miss).",
+    "coalesced_requests_total": "Calls that joined an identical in-flight call instead of running it again, by layer.",
+}
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram in the Prometheus sense: counts of observations <= each bound.
+    """
+    def __init__(self, buckets: tuple):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        """
+        [(upper bound, cumulative count)], ending with +Inf.
+        """
+        total, out = 0, []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            out.append((bound, total))
+        return out
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q-quantile; an estimate, like histogram_quantile.
+        """
+        if not self.count:
+            return float("nan")
+        for bound, total in self.cumulative():
+            if total >= q * self.count:
+                return bound
+        return float("inf")
+
+
+def format_labels(labels: tuple) -> str:
+    return ",".join(f'{k}="{v}"' for k, v in labels)
+
+
+class Metrics:
+    """
+    Process-wide, thread-safe metric registry: labelled histograms and counters,
+    rendered as a Prometheus text exposition or as a table for the debug panel.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram(HISTOGRAMS[name][0])
+            hist.observe(value)
+
+    def inc(self, name: str, amount: float = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def histograms(self) -> dict:
+        """
+        {(name, labels): Histogram} snapshot; the histograms are copies.
+        """
+        with self._lock:
+            out = {}
+            for key, hist in self._histograms.items():
+                copy = Histogram(hist.buckets)
+                copy.counts, copy.sum, copy.count = list(hist.counts), hist.sum, hist.count
+                out[key] = copy
+            return out
+
+    def counters(self) -> dict:
+        with self._lock:
+            return dict(self._counters)
+
+    def summary(self) -> pd.DataFrame:
+        """
+        One row per histogram series: count, mean and estimated p50/p95.
+        """
+        rows = []
+        for (name, labels), hist in sorted(self.histograms().items()):
+            rows.append({
+                "metric": name,
+                "labels": format_labels(labels),
+                "count": hist.count,
+                "mean": hist.sum / hist.count if hist.count else float("nan"),
+                "p50": hist.quantile(0.5),
+                "p95": hist.quantile(0.95),
+            })
+        return pd.DataFrame(rows, columns=["metric", "labels", "count", "mean", "p50", "p95"])
+
+    def render_prometheus(self) -> str:
+        lines = []
+        histograms = self.histograms()
+        for name, (_, help_text) in HISTOGRAMS.items():
+            series = sorted((labels, hist) for (n, labels), hist in histograms.items() if n == name)
+            if not series:
+                continue
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for labels, hist in series:
+                for bound, total in hist.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(float(bound))
+                    lines.append(f"{name}_bucket{{{format_labels(labels + (('le', le),))}}} {total}")
+                label_part = f"{{{format_labels(labels)}}}" if labels else ""
+                lines.append(f"{name}_sum{label_part} {hist.sum}")
+                lines.append(f"{name}_count{label_part} {hist.count}")
+        counters = self.counters()
+        for name, help_text in COUNTERS.items():
+            series = sorted((labels, value) for (n, labels), value in counters.items() if n == name)
+            if not series:
+                continue
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+            for labels, value in series:
+                label_part = f"{{{format_labels(labels)}}}" if labels else ""
+                lines.append(f"{name}{label_part} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str):
+        """
+        Write the exposition atomically, for node_exporter's textfile collector or any file scraper.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.render_prometheus())
+        os.replace(tmp, path)
+
+    def serve(self, host: str = "0.0.0.0", port: int = 9464) -> ThreadingHTTPServer:
+        """
+        Serve GET /metrics on a background thread and return the server.
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+        return server
+
+
+METRICS = Metrics()
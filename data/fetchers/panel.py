@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+
+class ColumnarPanel:
+    """
+    A wide indicator frame held column by column: one sorted date array plus one contiguous,
+    read-only array per column. A projection onto some columns and dates slices these arrays
+    and wraps the views in a DataFrame, so selecting a few series out of dozens copies nothing.
+    Projected frames share the panel's memory; write to a copy, not in place.
+    """
+    def __init__(self, dates: np.ndarray, columns: dict):
+        self.dates = dates
+        self.data = columns
+        for values in (dates, *columns.values()):
+            values.flags.writeable = False
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "ColumnarPanel":
+        if df.empty or "Date" not in df.columns:
+            return cls(np.array([], dtype="datetime64[ns]"), {})
+        df = df.sort_values("Date")
+        return cls(
+            np.ascontiguousarray(df["Date"].to_numpy(dtype="datetime64[ns]")),
+            {column: np.ascontiguousarray(df[column].to_numpy()) for column in df.columns if column != "Date"},
+        )
+
+    @property
+    def columns(self) -> list:
+        return list(self.data)
+
+    @property
+    def empty(self) -> bool:
+        return len(self.dates) == 0
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + sum(values.nbytes for values in self.data.values())
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def project(self, columns: list = None, start=None, end=None) -> pd.DataFrame:
+        """
+        Date plus the requested columns (all by default) over [start, end], without copying.
+        Unknown columns are skipped.
+        """
+        if self.empty:
+            return pd.DataFrame()
+        i = 0 if start is None else np.searchsorted(self.dates, np.datetime64(pd.Timestamp(start), "ns"), "left")
+        j = len(self.dates) if end is None else np.searchsorted(self.dates, np.datetime64(pd.Timestamp(end), "ns"), "right")
+        selected = self.columns if columns is None else [c for c in columns if c in self.data]
+        data = {"Date": self.dates[i:j]}
+        data.update({column: self.data[column][i:j] for column in selected})
+        return pd.DataFrame(data, copy=False)
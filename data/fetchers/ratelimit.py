@@ -0,0 +1,151 @@
+import heapq
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from data.fetchers.metrics import METRICS
+
+# Lower goes first: page loads are served before background refreshes
+LANES = {"interactive": 0, "background": 1}
+
+_local = threading.local()
+
+
+def current_lane() -> str:
+    return getattr(_local, "lane", "interactive")
+
+
+def set_lane(name: str):
+    """
+    Put the calling thread in a lane, e.g. as a ThreadPoolExecutor initializer.
+    """
+    _local.lane = name
+
+
+@contextmanager
+def lane(name: str):
+    previous = current_lane()
+    set_lane(name)
+    try:
+        yield
+    finally:
+        set_lane(previous)
+
+
+class LocalBucket:
+    """
+    In-memory token bucket for one process: `rate` tokens per second, at most `burst` saved up.
+    """
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+
+    def take(self) -> float:
+        """
+        Take a token and return 0, or return the seconds until one is available.
+        Not thread-safe on its own; RateLimiter serializes calls.
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0
+        return (1 - self._tokens) / self.rate
+
+
+class SQLiteBucket:
+    """
+    Token bucket kept in a SQLite file, so every dashboard process on a host draws from the
+    same budget for the shared API key. Each take is one short write transaction.
+    """
+    def __init__(self, path: str, rate: float, burst: float):
+        self.path = path
+        self.rate = rate
+        self.burst = burst
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("CREATE TABLE IF NOT EXISTS bucket (id INTEGER PRIMARY KEY CHECK (id = 0), tokens REAL NOT NULL, updated REAL NOT NULL)")
+            conn.execute("INSERT OR IGNORE INTO bucket VALUES (0, ?, ?)", (burst, time.time()))
+        finally:
+            conn.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def take(self) -> float:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            tokens, updated = conn.execute("SELECT tokens, updated FROM bucket WHERE id = 0").fetchone()
+            now = time.time()
+            tokens = min(self.burst, tokens + max(now - updated, 0) * self.rate)
+            wait = 0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / self.rate
+            conn.execute("UPDATE bucket SET tokens = ?, updated = ? WHERE id = 0", (tokens, now))
+            conn.execute("COMMIT")
+            return wait
+        finally:
+            conn.close()
+
+
+class RateLimiter:
+    """
+    Token-bucket limiter for outgoing EVDS requests with priority lanes.
+
+    Callers queue by lane and arrival; only the head of the queue may take a token, so a waiting
+    interactive request always goes before queued background refreshes. Time spent waiting is
+    recorded in evds_ratelimit_wait_seconds per lane.
+    """
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self._cond = threading.Condition()
+        self._queue = []
+        self._seq = itertools.count()
+
+    def acquire(self, lane_name: str = None):
+        lane_name = lane_name or current_lane()
+        ticket = (LANES.get(lane_name, len(LANES)), next(self._seq))
+        start = time.monotonic()
+        with self._cond:
+            heapq.heappush(self._queue, ticket)
+            try:
+                while True:
+                    if self._queue[0] == ticket:
+                        wait = self.bucket.take()
+                        if wait <= 0:
+                            break
+                        self._cond.wait(wait)
+                    else:
+                        self._cond.wait()
+            finally:
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+                self._cond.notify_all()
+        METRICS.observe("evds_ratelimit_wait_seconds", time.monotonic() - start, lane=lane_name)
+
+    def waiting(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+
+def open_limiter(rate: float, burst: float, path: str = "") -> RateLimiter:
+    """
+    Limiter for EVDS_RATE_LIMIT requests per second, process-wide or, with a path, shared by
+    every process using that file. Returns None when rate limiting is disabled (rate <= 0).
+    """
+    if rate <= 0:
+        return None
+    burst = max(burst, 1)
+    bucket = SQLiteBucket(path, rate, burst) if path else LocalBucket(rate, burst)
+    return RateLimiter(bucket)
@@ -0,0 +1,192 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from data.fetchers.derived import Derived
+
+# EVDS frequency codes
+DAILY = 1
+MONTHLY = 5
+QUARTERLY = 6
+
+# Extra calendar days to cover public holidays when backing up daily base periods
+HOLIDAY_SLACK_DAYS = 10
+
+
+def period_start(day: datetime, frequency: int) -> datetime:
+    """
+    First day of the period containing `day`. EVDS dates monthly and quarterly observations by the
+    period's first day, so a request starting later in the period would miss that observation.
+    """
+    if frequency == MONTHLY:
+        return day.replace(day=1)
+    if frequency == QUARTERLY:
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    return day
+
+
+@dataclass(frozen=True)
+class SeriesSpec:
+    """
+    One EVDS series and how its raw column is normalized.
+    float32 keeps ~7 significant digits, plenty for rates and indices published with 2-4 decimals.
+    """
+    column: str
+    code: str
+    frequency: int
+    date_format: str
+    dtype: str = "float32"
+
+    @property
+    def raw_column(self) -> str:
+        # EVDS returns series codes with dots replaced by underscores
+        return self.code.replace(".", "_")
+
+
+@dataclass(frozen=True)
+class Indicator:
+    """
+    A dashboard indicator: the series it is built from plus any derived columns.
+
+    base_periods: observations before the requested start that derived columns need (12 for a monthly YoY).
+    dropna: drop rows where any selected series is missing.
+    derived: columns computed from the selected series by the derived-indicator engine.
+    """
+    name: str
+    label: str
+    series: tuple
+    default_columns: tuple = ()
+    base_periods: int = 0
+    dropna: bool = False
+    derived: tuple = ()
+
+    @property
+    def frequency(self) -> int:
+        return self.series[0].frequency
+
+    @property
+    def date_format(self) -> str:
+        return self.series[0].date_format
+
+    def history_start(self, start: datetime) -> datetime:
+        """
+        First date to load so derived columns are complete from `start` on.
+        """
+        if not self.base_periods:
+            return start
+        if self.frequency == MONTHLY:
+            year, month = divmod(start.year * 12 + start.month - 1 - self.base_periods, 12)
+            return datetime(year, month + 1, 1)
+        return start - timedelta(days=self.base_periods * 7 // 5 + HOLIDAY_SLACK_DAYS)
+
+    def select(self, columns: list = None) -> list:
+        """
+        Series specs for the requested columns, or the default selection.
+        """
+        wanted = columns or self.default_columns
+        if not wanted:
+            return list(self.series)
+        return [spec for spec in self.series if spec.column in wanted]
+
+
+# Currencies in TCMB's daily indicative rate table, and those it also quotes banknote (effective) rates for
+FX_CURRENCIES = (
+    "USD", "EUR", "GBP", "CHF", "JPY", "AUD", "CAD", "DKK", "SEK", "NOK", "KWD", "SAR",
+    "BGN", "RON", "RUB", "IRR", "CNY", "PKR", "QAR", "KRW", "AZN", "AED",
+)
+FX_EFFECTIVE_CURRENCIES = ("USD", "EUR", "GBP", "CHF", "JPY", "AUD", "CAD", "DKK", "SEK", "NOK", "KWD", "SAR")
+
+# Rate type -> (column suffix, EVDS code suffix). Forex buying keeps the bare currency as its column.
+FX_RATES = {
+    "buying": ("", "A"),
+    "selling": ("_Selling", "S"),
+    "effective_buying": ("_EffBuying", "A.EF"),
+    "effective_selling": ("_EffSelling", "S.EF"),
+}
+
+
+# Windows, in observations, of the moving average and annualized volatility derived for every FX series
+FX_MA_WINDOW = 50
+FX_VOL_WINDOW = 30
+
+
+def fx_column(currency: str, rate: str = "buying") -> str:
+    return currency + FX_RATES[rate][0]
+
+
+def fx_ma_column(column: str) -> str:
+    return f"{column}_MA{FX_MA_WINDOW}"
+
+
+def fx_vol_column(column: str) -> str:
+    return f"{column}_Vol{FX_VOL_WINDOW}"
+
+
+def fx_panel() -> tuple:
+    """
+    Series specs of the full TCMB FX panel: forex buying and selling for every currency,
+    plus effective buying and selling where TCMB quotes them.
+    """
+    return tuple(
+        SeriesSpec(fx_column(currency, rate), f"TP.DK.{currency}.{suffix}", DAILY, "%d-%m-%Y")
+        for currency in FX_CURRENCIES
+        for rate, (_, suffix) in FX_RATES.items()
+        if not rate.startswith("effective") or currency in FX_EFFECTIVE_CURRENCIES
+    )
+
+
+INDICATORS = {
+    "cpi": Indicator(
+        name="cpi",
+        label="CPI data",
+        series=(
+            SeriesSpec("CPI_Index", "TP.FG.J0", MONTHLY, "%Y-%m"),
+        ),
+        base_periods=12,
+        derived=(
+            Derived("CPI_Annual", "CPI_Index", "pct_change", 12),
+            Derived("CPI_Monthly", "CPI_Index", "pct_change", 1),
+        ),
+    ),
+    "fx": Indicator(
+        name="fx",
+        label="data from TCMB",
+        series=fx_panel(),
+        default_columns=("USD", "EUR"),
+        # The moving average needs the most history: its window minus the day itself
+        base_periods=max(FX_MA_WINDOW - 1, FX_VOL_WINDOW),
+        derived=tuple(
+            d
+            for spec in fx_panel()
+            for d in (
+                Derived(fx_ma_column(spec.column), spec.column, "moving_average", FX_MA_WINDOW),
+                Derived(fx_vol_column(spec.column), spec.column, "volatility", FX_VOL_WINDOW),
+            )
+        ),
+    ),
+    "interest": Indicator(
+        name="interest",
+        label="Interest Rates",
+        # Weighted Average Funding Cost, used as proxy for the Policy Rate due to TP.PY.P01 restriction
+        series=(
+            SeriesSpec("Policy_Rate", "TP.APIFON4", DAILY, "%d-%m-%Y"),
+        ),
+        dropna=True,
+    ),
+    "production": Indicator(
+        name="production",
+        label="Production Data",
+        series=(
+            SeriesSpec("Capacity_Utilization", "TP.KKO.MA", MONTHLY, "%Y-%m"),
+        ),
+    ),
+    "labor": Indicator(
+        name="labor",
+        label="Labor Data",
+        series=(
+            SeriesSpec("Unemployment_Rate", "TP.TIG08", MONTHLY, "%Y-%m"),
+            SeriesSpec("Participation_Rate", "TP.TIG07", MONTHLY, "%Y-%m"),
+        ),
+    ),
+}
+
+SERIES_BY_CODE = {spec.code: spec for indicator in INDICATORS.values() for spec in indicator.series}
+INDICATOR_BY_CODE = {spec.code: indicator.name for indicator in INDICATORS.values() for spec in indicator.series}
@@ -0,0 +1,180 @@
+import hashlib
+from abc import ABC, abstractmethod
+import io
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+import numpy as np
+import pandas as pd
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Bump when the serialized frame layout changes; entries written by other versions are ignored
+FORMAT_VERSION = 1
+
+
+def frame_key(name: str, start_date: str, end_date: str, columns: list = None) -> str:
+    selection = ",".join(columns) if columns else "default"
+    if len(selection) > 64:
+        # Full panels select dozens of columns; keep keys short
+        selection = hashlib.blake2b(selection.encode(), digest_size=12).hexdigest()
+    return f"{indicator_prefix(name)}{start_date}:{end_date}:{selection}"
+
+
+def indicator_prefix(name: str) -> str:
+    """
+    Common prefix of every frame_key of an indicator.
+    """
+    return f"evds:v{FORMAT_VERSION}:{name}:"
+
+
+def dump_frame(df: pd.DataFrame) -> bytes:
+    """
+    Serialize an indicator frame column by column into an .npz archive. Only plain numeric and
+    datetime columns are supported, so loading never needs pickle.
+    """
+    arrays = {"__columns__": np.array(list(df.columns), dtype=str)}
+    for i, column in enumerate(df.columns):
+        values = df[column].to_numpy()
+        if values.dtype == object:
+            raise ValueError(f"column {column!r} is not numeric or datetime")
+        arrays[f"c{i}"] = values
+    buf = io.BytesIO()
+    np.savez(buf, **arrays)
+    return buf.getvalue()
+
+
+def load_frame(payload: bytes) -> pd.DataFrame:
+    with np.load(io.BytesIO(payload), allow_pickle=False) as archive:
+        columns = archive["__columns__"].tolist()
+        return pd.DataFrame({column: archive[f"c{i}"] for i, column in enumerate(columns)}, columns=columns)
+
+
+class SharedCache(ABC):
+    """
+    Byte cache with per-entry TTL that several dashboard processes can share.
+    Backends implement get/set/clear; frames go through get_frame/set_frame.
+    """
+    @abstractmethod
+    def get(self, key: str):
+        """
+        Stored bytes for a key, or None when it is missing or expired.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float):
+        """
+        Store bytes under a key for ttl seconds.
+        """
+
+    @abstractmethod
+    def clear(self, prefix: str = ""):
+        """
+        Drop every entry, or those whose key starts with prefix.
+        """
+
+    def get_frame(self, key: str):
+        """
+        Cached frame for a key, or None when it is missing, expired or unreadable.
+        """
+        payload = self.get(key)
+        if payload is None:
+            return None
+        try:
+            return load_frame(payload)
+        except (ValueError, KeyError, OSError):
+            return None
+
+    def set_frame(self, key: str, df: pd.DataFrame, ttl: float):
+        try:
+            payload = dump_frame(df)
+        except ValueError:
+            # Object columns would need pickle; leave such frames to the per-process caches
+            return
+        self.set(key, payload, ttl)
+
+
+class SQLiteCache(SharedCache):
+    """
+    Shared cache in a local SQLite file, for worker processes on one host.
+    Expired entries are skipped on read and purged on write.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str):
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM entries WHERE key = ? AND expires_at > ?", (key, time.time())).fetchone()
+        return None if row is None else bytes(row[0])
+
+    def set(self, key: str, value: bytes, ttl: float):
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+            conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?)", (key, value, now + ttl))
+
+    def clear(self, prefix: str = ""):
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+
+class RedisCache(SharedCache):
+    """
+    Shared cache on a Redis-protocol server (Redis, Valkey, KeyDB), for workers on several hosts.
+    Entries expire server-side. Needs the optional `redis` package.
+    """
+    PREFIX = "evds:"
+
+    def __init__(self, url: str):
+        if redis is None:
+            raise ImportError("RedisCache needs the redis package: pip install redis")
+        self.client = redis.Redis.from_url(url, socket_timeout=2)
+
+    def get(self, key: str):
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self.client.set(key, value, px=max(1, int(ttl * 1000)))
+
+    def clear(self, prefix: str = ""):
+        for key in self.client.scan_iter(f"{prefix or self.PREFIX}*"):
+            self.client.delete(key)
+
+
+def open_shared_cache(url: str) -> SharedCache:
+    """
+    Backend for a SHARED_CACHE_URL: redis://host:port/db (or rediss://), sqlite:///path/to/file,
+    or a plain file path for SQLite. Returns None for an empty URL.
+    """
+    if not url:
+        return None
+    scheme = urlsplit(url).scheme
+    if scheme in ("redis", "rediss", "unix"):
+        return RedisCache(url)
+    if scheme == "sqlite":
+        return SQLiteCache(url[len("sqlite:///"):] if url.startswith("sqlite:///") else url[len("sqlite://"):])
+    return SQLiteCache(url)
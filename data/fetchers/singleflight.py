@@ -0,0 +1,50 @@
+import threading
+from data.fetchers.metrics import METRICS
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Request coalescing: while a call for a key is in flight, concurrent calls for the same key
+    wait for it and share its result (or its exception) instead of running again.
+    Waiters are counted in coalesced_requests_total, labelled with this group's layer.
+    """
+    def __init__(self, layer: str):
+        self.layer = layer
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            METRICS.inc("coalesced_requests_total", layer=self.layer)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,131 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+import pandas as pd
+from data.fetchers.intervals import missing_spans, trusted_spans
+
+# Bump when the table layout changes; older store files are rebuilt from scratch
+SCHEMA_VERSION = 2
+
+class SeriesStore:
+    """
+    On-disk SQLite store of EVDS observations, keyed by series code and frequency.
+    Loaded frames have the same Date-plus-code-columns layout as a decoded live response.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS observations")
+                conn.execute("DROP TABLE IF EXISTS coverage")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS observations (
+                    code TEXT NOT NULL,
+                    frequency INTEGER NOT NULL,
+                    date TEXT NOT NULL,
+                    value REAL,
+                    PRIMARY KEY (code, frequency, date)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS coverage (
+                    code TEXT NOT NULL,
+                    frequency INTEGER NOT NULL,
+                    start TEXT NOT NULL,
+                    end TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def upsert(self, df: pd.DataFrame, codes: list, frequency: int):
+        """
+        Merge a decoded raw frame into the store. Newer values replace older ones, so revisions win.
+        """
+        if df.empty or "Date" not in df.columns:
+            return
+        dates = df["Date"].dt.strftime("%Y-%m-%d")
+        rows = []
+        for code in codes:
+            col = code.replace(".", "_")
+            if col not in df.columns:
+                continue
+            for date, value in zip(dates, df[col]):
+                if isinstance(date, str):
+                    rows.append((code, frequency or 0, date, None if pd.isna(value) else float(value)))
+        with self._lock, self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO observations VALUES (?, ?, ?, ?)", rows)
+
+    def load(self, codes: list, frequency: int, start: datetime, end: datetime) -> pd.DataFrame:
+        """
+        Read stored observations back as a wide raw frame: Date plus one column per series code.
+        """
+        placeholders = ",".join("?" * len(codes))
+        with self._connect() as conn:
+            df = pd.read_sql_query(
+                f"SELECT code, date, value FROM observations "
+                f"WHERE frequency = ? AND code IN ({placeholders}) AND date >= ? AND date <= ? ORDER BY date",
+                conn,
+                params=[frequency or 0, *codes, start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")],
+            )
+        if df.empty:
+            return pd.DataFrame()
+        df["code"] = df["code"].str.replace(".", "_", regex=False)
+        wide = df.pivot(index="date", columns="code", values="value")
+        wide.index = pd.to_datetime(wide.index, format="%Y-%m-%d")
+        wide.index.name = "Date"
+        wide.columns.name = None
+        return wide.reset_index()
+
+    def missing(self, codes: list, frequency: int, start: datetime, end: datetime, ttl: float, revision_days: int) -> dict:
+        """
+        Date spans within [start, end] that have never been fetched, per series code,
+        plus the revision window at the live edge of spans older than the TTL.
+        """
+        gaps = {}
+        with self._connect() as conn:
+            for code in codes:
+                rows = conn.execute(
+                    "SELECT start, end, fetched_at FROM coverage WHERE code = ? AND frequency = ?",
+                    (code, frequency or 0),
+                ).fetchall()
+                spans = [(datetime.fromisoformat(s), datetime.fromisoformat(e), t) for s, e, t in rows]
+                gaps[code] = missing_spans(trusted_spans(spans, ttl, revision_days), start, end)
+        return gaps
+
+    def record_coverage(self, codes: list, frequency: int, start: datetime, end: datetime):
+        """
+        Remember that [start, end] was fetched for the codes, dropping spans the new one contains.
+        """
+        s, e = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+        with self._lock, self._connect() as conn:
+            for code in codes:
+                conn.execute(
+                    "DELETE FROM coverage WHERE code = ? AND frequency = ? AND start >= ? AND end <= ?",
+                    (code, frequency or 0, s, e),
+                )
+                conn.execute(
+                    "INSERT INTO coverage VALUES (?, ?, ?, ?, ?)",
+                    (code, frequency or 0, s, e, time.time()),
+                )
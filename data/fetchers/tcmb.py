@@ -1,12 +1,90 @@
 import requests
-import ssl
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from requests.adapters import HTTPAdapter
 from urllib3.poolmanager import PoolManager
 from urllib3.util.ssl_ import create_urllib3_context
 import streamlit as st
+from streamlit.runtime.caching import get_data_cache_stats_provider
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from config.settings import TCMB_API_KEY
+from functools import lru_cache
+from config.settings import (
+    TCMB_API_KEY, TCMB_BASE_URL, CACHE_TTL, HTTP_POOL_SIZE, SERIES_STORE_PATH, REVISION_WINDOW_DAYS,
+    RETRY_ATTEMPTS, BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS, FETCH_CHUNK_DAYS, FETCH_CHUNK_WORKERS,
+    SHARED_CACHE_URL, EVDS_RATE_LIMIT, EVDS_RATE_BURST, EVDS_RATE_LIMIT_PATH,
+)
+from data.fetchers.batch import SeriesRequest, plan_batches, split_batch, split_window
+from data.fetchers.decode import decode_items
+from data.fetchers.derived import apply_derived
+from data.fetchers.intervals import IntervalCache, group_by_gaps
+from data.fetchers.metrics import METRICS
+from data.fetchers.panel import ColumnarPanel
+from data.fetchers.ratelimit import RateLimiter, current_lane, lane, open_limiter, set_lane
+from data.fetchers.registry import INDICATOR_BY_CODE, INDICATORS, MONTHLY, Indicator, fx_column, period_start
+from data.fetchers.resilience import CircuitBreaker, call_with_retry
+from data.fetchers.shared_cache import SharedCache, frame_key, indicator_prefix, open_shared_cache
+from data.fetchers.singleflight import SingleFlight
+from data.fetchers.store import SeriesStore
+
+logger = logging.getLogger(__name__)
+
+DATE_FMT = "%d-%m-%Y"
+
+# Set when the body of _fetch_cached runs, i.e. st.cache_data missed
+_cache_probe = threading.local()
+
+# Shared by every client in the process, so a range fetched by one page serves the others
+SHARED_INTERVALS = IntervalCache(ttl=CACHE_TTL, revision_days=REVISION_WINDOW_DAYS)
+
+# Concurrent identical upstream requests, and shared-cache misses for the same frame, run once
+UPSTREAM_FLIGHTS = SingleFlight("upstream")
+FRAME_FLIGHTS = SingleFlight("indicator")
+
+# Panels currently held by st.cache_resource, for memory_report; evicted panels drop out
+_live_panels = weakref.WeakValueDictionary()
+
+# Arguments of recent st.cache_data / st.cache_resource calls, so a background refresh can clear
+# just the entries of the series it refreshed. Entries pushed out of this bound simply expire by TTL.
+_cached_calls = OrderedDict()
+_cached_calls_lock = threading.Lock()
+CACHED_CALLS_MAX = 512
+
+# Bumped per indicator whenever a background refresh lands, and passed to the cached functions.
+# A page run that started on stale data may store its frame after the refresh cleared the cache;
+# that entry is keyed by the old generation, so it is never looked up again.
+_generations = {}
+
+def _remember_call(kind: str, *args):
+    key = (kind, *args)
+    with _cached_calls_lock:
+        _cached_calls[key] = None
+        _cached_calls.move_to_end(key)
+        while len(_cached_calls) > CACHED_CALLS_MAX:
+            _cached_calls.popitem(last=False)
+
+@lru_cache(maxsize=None)
+def _shared_store(path: str) -> SeriesStore:
+    return SeriesStore(path)
+
+@lru_cache(maxsize=None)
+def _shared_cache(url: str) -> SharedCache:
+    return open_shared_cache(url)
+
+@lru_cache(maxsize=None)
+def _shared_limiter(rate: float, burst: int, path: str) -> RateLimiter:
+    return open_limiter(rate, burst, path)
+
+def request_label(series: list) -> str:
+    """
+    Metric label for an EVDS request: the indicators its series belong to, e.g. "interest+production".
+    The series list itself varies with column selections and batching, so it is not used as a label.
+    """
+    return "+".join(sorted({INDICATOR_BY_CODE.get(code, "other") for code in series}))
 
 class CustomSSLAdapter(HTTPAdapter):
     """
@@ -24,85 +102,548 @@ class CustomSSLAdapter(HTTPAdapter):
             **pool_kwargs
         )
 
+def normalize(indicator: Indicator, df: pd.DataFrame, specs: list) -> pd.DataFrame:
+    """
+    Turn a decoded raw frame (Date plus one column per EVDS code) into an indicator frame:
+    one column per selected series, named after the spec, plus any derived columns.
+    """
+    if df.empty or "Date" not in df.columns:
+        return pd.DataFrame()
+
+    with METRICS.timer("indicator_normalize_seconds", indicator=indicator.name):
+        return _normalize(indicator, df, specs)
+
+def _normalize(indicator: Indicator, df: pd.DataFrame, specs: list) -> pd.DataFrame:
+    out = pd.DataFrame({"Date": df["Date"]})
+    for spec in specs:
+        if spec.raw_column in df.columns:
+            out[spec.column] = df[spec.raw_column].astype(spec.dtype, copy=False)
+
+    out = out.sort_values("Date").reset_index(drop=True)
+
+    if indicator.dropna:
+        out = out.dropna(subset=[spec.column for spec in specs if spec.column in out.columns])
+
+    return apply_derived(out, indicator.derived)
+
 class TCMBClient:
-    BASE_URL = "https://evds3.tcmb.gov.tr/igmevdsms-dis"
-    
-    def __init__(self, api_key: str = None):
+    BASE_URL = TCMB_BASE_URL
+    USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+    def __init__(self, api_key: str = None, store: SeriesStore = None, intervals: IntervalCache = None, pool_size: int = None, base_url: str = None, shared: SharedCache = None, limiter: RateLimiter = None):
         self.api_key = api_key or TCMB_API_KEY
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.pool_size = pool_size or HTTP_POOL_SIZE
         self.session = requests.Session()
-        self.session.mount('https://', CustomSSLAdapter())
-    
-    @st.cache_data(ttl=3600)
-    def get_exchange_rates(_self, start_date: str, end_date: str, currencies: list = ["USD", "EUR"]) -> pd.DataFrame:
+        self.adapter = CustomSSLAdapter(pool_connections=1, pool_maxsize=self.pool_size)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        if store is None and SERIES_STORE_PATH:
+            store = _shared_store(SERIES_STORE_PATH)
+        self.store = store
+        self.intervals = intervals or SHARED_INTERVALS
+        if shared is None and SHARED_CACHE_URL:
+            shared = _shared_cache(SHARED_CACHE_URL)
+        self.shared = shared
+        # One bucket per process for the one API key, unless a limiter is passed in
+        self.limiter = limiter or _shared_limiter(EVDS_RATE_LIMIT, EVDS_RATE_BURST, EVDS_RATE_LIMIT_PATH)
+        self.breaker = CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS)
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+
+    def pool_stats(self) -> dict:
         """
-        Fetch exchange rates from TCMB.
-        Note: Using _self to exclude self from cache hashing.
+        Connection pool statistics per host. `connections` counts opened connections, i.e. TLS
+        handshakes; `requests` much larger than `connections` means keep-alive reuse is working.
         """
-        if not _self.api_key:
-            st.error("TCMB API Key is missing. Please set TCMB_API_KEY in .env file.")
-            return pd.DataFrame()
+        stats = {}
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "connections": pool.num_connections,
+                "requests": pool.num_requests,
+                "idle": sum(1 for conn in pool.pool.queue if conn is not None) if pool.pool is not None else 0,
+                "maxsize": self.pool_size,
+            }
+        return stats
 
-        series_map = {
-            "USD": "TP.DK.USD.A",
-            "EUR": "TP.DK.EUR.A",
-            "GBP": "TP.DK.GBP.A"
-        }
-        
-        selected_series = [series_map[c] for c in currencies if c in series_map]
-        series_str = "-".join(selected_series)
-        
+    def _request_items(self, series: list, start_date: str, end_date: str, frequency: int = None) -> pd.DataFrame:
+        """
+        Decoded raw frame for one EVDS request. When the identical request is already in flight
+        (another session hit the same expired range at the same moment) this waits for it and
+        shares its result instead of sending a duplicate. Raises on failure.
+        """
+        key = (self.base_url, "-".join(series), start_date, end_date, frequency)
+        return UPSTREAM_FLIGHTS.do(key, lambda: self._send_request(series, start_date, end_date, frequency))
+
+    def _send_request(self, series: list, start_date: str, end_date: str, frequency: int = None) -> pd.DataFrame:
+        """
+        Send one EVDS request for a dash-joined series list and return the decoded raw frame.
+        Transient failures are retried with jittered backoff; repeated failures open the circuit
+        breaker so callers fail fast instead of piling onto a dead upstream. Raises on failure.
+        """
         params = {
-            "series": series_str,
+            "series": "-".join(series),
             "startDate": start_date,
             "endDate": end_date,
-            "type": "json",
-            "key": _self.api_key,
-            "frequency": 1
+            "type": "json"
         }
+        if frequency is not None:
+            params["frequency"] = frequency
         
-        params_no_key = {k: v for k, v in params.items() if k != "key"}
-        query_string = "&".join([f"{k}={v}" for k, v in params_no_key.items()])
-        base_api_url = "https://evds3.tcmb.gov.tr/igmevdsms-dis"
-        url = f"{base_api_url}/{query_string}"
+        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        url = f"{self.base_url}/{query_string}"
         
         headers = {
-            "key": _self.api_key,
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+            "key": self.api_key,
+            "User-Agent": self.USER_AGENT
         }
         
-        try:
-            response = _self.session.get(url, headers=headers, timeout=15)
+        attempts = 0
+
+        def send():
+            nonlocal attempts
+            if attempts and self.limiter is not None:
+                # Retries count against the quota too
+                self.limiter.acquire()
+            attempts += 1
+            response = self.session.get(url, headers=headers, timeout=15)
             response.raise_for_status()
-            data = response.json()
-            
-            if "items" not in data:
-                return pd.DataFrame()
-                
-            df = pd.DataFrame(data["items"])
-            
-            if "Tarih" in df.columns:
-                df["Date"] = pd.to_datetime(df["Tarih"], format="%d-%m-%Y")
-            
-            rename_dict = {}
-            for k, v in series_map.items():
-                api_key_name = v.replace(".", "_")
-                if api_key_name in df.columns:
-                    rename_dict[api_key_name] = k
-            
-            df.rename(columns=rename_dict, inplace=True)
-            
-            for col in currencies:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-            
-            return df.sort_values("Date") if "Date" in df.columns else df
-            
+            return response
+
+        label = request_label(series)
+        self.breaker.before_call()
+        if self.limiter is not None:
+            self.limiter.acquire()
+        try:
+            with METRICS.timer("evds_request_seconds", indicator=label):
+                response = call_with_retry(send, attempts=RETRY_ATTEMPTS)
+        except Exception:
+            self.breaker.record_failure()
+            METRICS.inc("evds_request_errors_total", indicator=label)
+            raise
+        self.breaker.record_success()
+        with METRICS.timer("evds_decode_seconds", indicator=label):
+            df = decode_items(response.content, series)
+        METRICS.observe("evds_response_bytes", len(response.content), indicator=label)
+        METRICS.observe("evds_response_rows", len(df), indicator=label)
+        return df
+
+    def _request_chunks(self, series: list, start: datetime, end: datetime, frequency: int = None):
+        """
+        Request [start, end] as consecutive date windows (FETCH_CHUNK_DAYS) in parallel over the
+        pooled session, at most FETCH_CHUNK_WORKERS at a time. Yields (window start, window end,
+        raw frame) as each chunk arrives and is decoded, so a deep history is never held as one
+        response body and no single request runs into the timeout.
+        """
+        windows = split_window(start, end, FETCH_CHUNK_DAYS.get(frequency, 1826), frequency == MONTHLY)
+        if len(windows) == 1:
+            yield start, end, self._request_items(series, start.strftime(DATE_FMT), end.strftime(DATE_FMT), frequency)
+            return
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(FETCH_CHUNK_WORKERS, len(windows)), thread_name_prefix="evds-chunk",
+            initializer=set_lane, initargs=(current_lane(),),
+        )
+        try:
+            futures = {
+                pool.submit(self._request_items, series, s.strftime(DATE_FMT), e.strftime(DATE_FMT), frequency): (s, e)
+                for s, e in windows
+            }
+            for future in as_completed(futures):
+                s, e = futures[future]
+                yield s, e, future.result()
+        finally:
+            # On a failed chunk, windows that have not started yet are not sent at all
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _request_range(self, series: list, start: datetime, end: datetime, frequency: int = None) -> pd.DataFrame:
+        """
+        Raw frame for [start, end], fetched in chunks and stitched back together in date order.
+        """
+        chunks = sorted(self._request_chunks(series, start, end, frequency), key=lambda chunk: chunk[0])
+        frames = [df for _, _, df in chunks if not df.empty]
+        if not frames:
+            return chunks[0][2]
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    def _load_items(self, series: list, start_date: str, end_date: str, frequency: int = None) -> pd.DataFrame:
+        """
+        Raw items for a series list over [start_date, end_date].
+        Spans already held by the interval cache are sliced locally; only the missing edges are loaded.
+        Held data past its TTL is served as is while a background refresh revalidates it.
+        """
+        start = datetime.strptime(start_date, DATE_FMT)
+        end = datetime.strptime(end_date, DATE_FMT)
+        start = period_start(start, frequency)
+
+        self._fill_gaps(self.intervals.missing(series, frequency, start, end, stale_ok=True), frequency, stale_ok=True)
+
+        if any(self.intervals.missing(series, frequency, start, end).values()):
+            self._revalidate(series, frequency, start, end)
+
+        return self.intervals.get(series, frequency, start, end)
+
+    def _fill_gaps(self, gaps_by_code: dict, frequency: int, stale_ok: bool = False):
+        for codes, gaps in group_by_gaps(gaps_by_code):
+            for gap_start, gap_end in gaps:
+                # A held span may end mid-period (a trimmed revision edge); refetch that period whole
+                gap_start = period_start(gap_start, frequency)
+                raw, stale = self._load_span(codes, gap_start, gap_end, frequency, stale_ok)
+                # Expired store data goes in as already expired, so _load_items revalidates it
+                self.intervals.put(raw, codes, frequency, gap_start, gap_end, fetched_at=0 if stale else None)
+
+    def _revalidate(self, series: list, frequency: int, start: datetime, end: datetime):
+        """
+        Refresh the stale edges of a range on a background thread, at most once at a time per series list.
+        Once fresh data lands, cached frames of indicators using these series are dropped so the next rerun picks it up.
+        """
+        key = (tuple(series), frequency)
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                # Page loads waiting for the rate limiter go before this refresh
+                with lane("background"):
+                    self._fill_gaps(self.intervals.missing(series, frequency, start, end), frequency)
+                self._clear_cached(series)
+            except Exception as e:
+                logger.warning("Background refresh of %s failed: %s", "-".join(series), e)
+            finally:
+                with self._refresh_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="evds-revalidate", daemon=True).start()
+
+    def _clear_cached(self, series: list):
+        """
+        Drop the st.cache_data frames, st.cache_resource panels and shared-cache frames built from
+        any of these series, so no process keeps serving what the refresh replaced.
+        """
+        codes = set(series)
+        names = {name for name, indicator in INDICATORS.items() if codes.intersection(spec.code for spec in indicator.series)}
+        if self.shared is not None:
+            for name in names:
+                self._shared_clear(name)
+        with _cached_calls_lock:
+            for name in names:
+                _generations[name] = _generations.get(name, 0) + 1
+            calls = [call for call in _cached_calls if call[1] in names]
+            for call in calls:
+                del _cached_calls[call]
+        for kind, *args in calls:
+            if kind == "frame":
+                self._fetch_cached.clear(*args)
+            else:
+                self._panel_cached.clear(*args)
+
+    def _load_span(self, series: list, start: datetime, end: datetime, frequency: int = None, stale_ok: bool = False) -> tuple:
+        """
+        (raw items, stale) for one span the interval cache does not hold, read through the local
+        series store when one is configured. Upstream is only asked for what the store has not
+        fetched yet, plus the revision window at the live edge. With stale_ok an expired revision
+        window is served from the store as is and reported as stale, so a restarted worker shows
+        the last good data while EVDS is slow or down, and the caller revalidates in the background.
+        """
+        if self.store is None:
+            return self._request_range(series, start, end, frequency), False
+
+        revision = REVISION_WINDOW_DAYS.get(frequency, 7)
+        stale = False
+        if stale_ok:
+            stale = any(self.store.missing(series, frequency, start, end, CACHE_TTL, revision).values())
+        ttl = float("inf") if stale_ok else CACHE_TTL
+        for codes, gaps in group_by_gaps(self.store.missing(series, frequency, start, end, ttl, revision)):
+            for gap_start, gap_end in gaps:
+                gap_start = period_start(gap_start, frequency)
+                # Each chunk is stored as it arrives, so a failure later on keeps what was already fetched
+                for chunk_start, chunk_end, fresh in self._request_chunks(codes, gap_start, gap_end, frequency):
+                    self.store.upsert(fresh, codes, frequency)
+                    self.store.record_coverage(codes, frequency, chunk_start, chunk_end)
+
+        return self.store.load(series, frequency, start, end), stale
+
+    def _with_base_history(self, indicator: Indicator, specs: list, raw: pd.DataFrame, start_date: str) -> pd.DataFrame:
+        """
+        Prepend the base periods an indicator's derived columns need (e.g. the year before the
+        range for YoY) to a raw frame of a batch covering the requested range. They are loaded for
+        this indicator's own series only, so batch partners are not widened to that history, and
+        through the interval cache and store, so a base period is transferred once and reused.
+        """
+        start = period_start(datetime.strptime(start_date, DATE_FMT), indicator.frequency)
+        history_start = indicator.history_start(start)
+        if history_start >= start:
+            return raw
+        base = self._load_items(
+            [spec.code for spec in specs],
+            history_start.strftime(DATE_FMT),
+            (start - timedelta(days=1)).strftime(DATE_FMT),
+            indicator.frequency,
+        )
+        if base.empty:
+            return raw
+        if raw.empty:
+            return base
+        return pd.concat([base, raw], ignore_index=True)
+
+    def _series_request(self, name: str, start_date: str, end_date: str) -> SeriesRequest:
+        indicator = INDICATORS[name]
+        return SeriesRequest(
+            name=name,
+            codes=[spec.code for spec in indicator.select()],
+            frequency=indicator.frequency,
+            start=datetime.strptime(start_date, DATE_FMT),
+            end=datetime.strptime(end_date, DATE_FMT),
+        )
+
+    def fetch(self, name: str, start_date: str, end_date: str, columns: list = None) -> pd.DataFrame:
+        """
+        Fetch and normalize any registered indicator. Raises on upstream errors.
+        columns selects a subset of the indicator's series (e.g. currencies); defaults to its default selection.
+        """
+        indicator = INDICATORS[name]
+        specs = indicator.select(columns)
+        # A single indicator loads its base periods together with the range itself
+        history_start = indicator.history_start(datetime.strptime(start_date, DATE_FMT)).strftime(DATE_FMT)
+        raw = self._load_items([spec.code for spec in specs], history_start, end_date, indicator.frequency)
+        return self._slice_window(normalize(indicator, raw, specs), indicator.frequency, start_date, end_date)
+
+    def _shared_get(self, key: str):
+        """
+        Frame from the shared cache, or None on a miss. A broken backend counts as a miss,
+        so an unreachable Redis degrades to per-process caching instead of failing pages.
+        """
+        try:
+            return self.shared.get_frame(key)
+        except Exception as e:
+            logger.warning("Shared cache read failed: %s", e)
+            return None
+
+    def _shared_set(self, key: str, df: pd.DataFrame, ttl: float = CACHE_TTL):
+        if ttl <= 0:
+            return
+        try:
+            self.shared.set_frame(key, df, ttl)
+        except Exception as e:
+            logger.warning("Shared cache write failed: %s", e)
+
+    def _shared_clear(self, name: str):
+        try:
+            self.shared.clear(indicator_prefix(name))
         except Exception as e:
-            st.error(f"Error fetching data from TCMB: {str(e)}")
+            logger.warning("Shared cache clear failed: %s", e)
+
+    def _shared_ttl(self, name: str, start_date: str, end_date: str, columns: list = None) -> float:
+        """
+        How long a frame for this range may be shared: CACHE_TTL, cut down to when the held data
+        it is built from needs revalidating, and 0 (not shared) when that data is already stale.
+        """
+        indicator = INDICATORS[name]
+        start = indicator.history_start(datetime.strptime(start_date, DATE_FMT))
+        codes = [spec.code for spec in indicator.select(columns)]
+        fresh = self.intervals.fresh_for(codes, indicator.frequency, start, datetime.strptime(end_date, DATE_FMT))
+        return max(0, min(CACHE_TTL, fresh))
+
+    def fetch_shared(self, name: str, start_date: str, end_date: str, columns: list = None) -> pd.DataFrame:
+        """
+        fetch() through the shared cache, so an indicator range fetched by one worker process
+        is served to every other one without another upstream call. Raises on upstream errors.
+        """
+        if self.shared is None:
+            return self.fetch(name, start_date, end_date, columns)
+        key = frame_key(name, start_date, end_date, columns)
+        df = self._shared_get(key)
+        METRICS.inc("shared_cache_requests_total", indicator=name, result="miss" if df is None else "hit")
+        if df is None:
+            df = FRAME_FLIGHTS.do((self.base_url, key), lambda: self._fetch_to_shared(key, name, start_date, end_date, columns))
+        return df
+
+    def _fetch_to_shared(self, key: str, name: str, start_date: str, end_date: str, columns: list = None) -> pd.DataFrame:
+        # Checked before and after: a refresh may land during the fetch, and a fetch may serve stale store data
+        ttl = self._shared_ttl(name, start_date, end_date, columns)
+        df = self.fetch(name, start_date, end_date, columns)
+        self._shared_set(key, df, min(ttl, self._shared_ttl(name, start_date, end_date, columns)))
+        return df
+
+    @st.cache_data(ttl=CACHE_TTL)
+    def _fetch_cached(_self, name: str, start_date: str, end_date: str, columns: tuple = None, generation: int = 0) -> pd.DataFrame:
+        """
+        st.cache_data layer over fetch(). Errors propagate, so failures are never cached as data.
+        generation only keys the entry; see _generations.
+        """
+        _cache_probe.missed = True
+        return _self.fetch(name, start_date, end_date, list(columns) if columns else None)
+
+    @st.cache_resource(ttl=CACHE_TTL, max_entries=16)
+    def _panel_cached(_self, name: str, start_date: str, end_date: str, columns: tuple, generation: int = 0) -> ColumnarPanel:
+        """
+        The selected series of an indicator as a ColumnarPanel. st.cache_resource hands every caller
+        the same panel instead of a copy, so projections from it stay zero-copy. Errors propagate.
+        """
+        panel = ColumnarPanel.from_frame(_self.fetch_shared(name, start_date, end_date, list(columns)))
+        _live_panels[(name, start_date, end_date, columns)] = panel
+        return panel
+
+    def get_panel(self, name: str, start_date: str, end_date: str, columns: list = None) -> ColumnarPanel:
+        """
+        Cached panel of the given columns (every series of the indicator by default) for page code:
+        a missing key yields an empty panel and errors are reported with st.error.
+        Series already loaded for another selection come from the interval cache, so widening a
+        selection only fetches the series it adds.
+        """
+        if not self.api_key:
+            return ColumnarPanel.from_frame(pd.DataFrame())
+        columns = tuple(sorted(columns or [spec.column for spec in INDICATORS[name].series]))
+        try:
+            args = (name, start_date, end_date, columns, _generations.get(name, 0))
+            _remember_call("panel", *args)
+            return self._panel_cached(*args)
+        except Exception as e:
+            st.error(f"Error fetching {INDICATORS[name].label}: {e}")
+            return ColumnarPanel.from_frame(pd.DataFrame())
+
+    def _get(self, name: str, start_date: str, end_date: str, columns: list = None) -> pd.DataFrame:
+        """
+        Cached fetch for page code: a missing key yields an empty frame and errors are reported with st.error.
+        With a shared cache configured it is consulted first, in place of the per-process st.cache_data,
+        so no worker serves a frame older than the shared entry.
+        """
+        if not self.api_key:
             return pd.DataFrame()
+        _cache_probe.missed = False
+        try:
+            if self.shared is not None:
+                return self.fetch_shared(name, start_date, end_date, columns)
+            args = (name, start_date, end_date, tuple(columns) if columns else None, _generations.get(name, 0))
+            _remember_call("frame", *args)
+            df = self._fetch_cached(*args)
+            METRICS.inc("indicator_cache_requests_total", indicator=name, result="miss" if _cache_probe.missed else "hit")
+            return df
+        except Exception as e:
+            st.error(f"Error fetching {INDICATORS[name].label}: {e}")
+            return pd.DataFrame()
+
+    def _fetch_batch(self, series: tuple, start_date: str, end_date: str, frequency: int) -> pd.DataFrame:
+        """
+        Raw frame for one planned batch. Not wrapped in st.cache_data: the interval cache already
+        holds these observations, so a second copy per batch window would only cost memory.
+        """
+        return self._load_items(list(series), start_date, end_date, frequency)
+
+    def iter_indicators(self, start_date: str, end_date: str, indicators: list = None, max_workers: int = None):
+        """
+        Fetch several indicators in parallel and yield (name, DataFrame) pairs as each one completes.
+        Series are grouped into batches by frequency and date window, so the Overview page
+        needs one upstream call per batch instead of one per indicator.
+        """
+        names = list(indicators or INDICATORS)
+        if not self.api_key:
+            for name in names:
+                yield name, pd.DataFrame()
+            return
+
+        if self.shared is not None:
+            # Indicators another worker already fetched come straight from the shared cache
+            pending = []
+            for name in names:
+                df = self._shared_get(frame_key(name, start_date, end_date))
+                METRICS.inc("shared_cache_requests_total", indicator=name, result="miss" if df is None else "hit")
+                if df is None:
+                    pending.append(name)
+                else:
+                    yield name, df
+            names = pending
+            if not names:
+                return
+
+        batches = plan_batches([self._series_request(name, start_date, end_date) for name in names])
+        if self.shared is not None:
+            shared_ttls = {name: self._shared_ttl(name, start_date, end_date) for name in names}
+        ctx = get_script_run_ctx()
+
+        def attach_ctx():
+            # Worker threads need the script context for st.cache_data and st.error
+            if ctx is not None:
+                add_script_run_ctx(threading.current_thread(), ctx)
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(batches), initializer=attach_ctx) as pool:
+            futures = {
+                pool.submit(self._fetch_batch, tuple(batch.codes), batch.start_str, batch.end_str, batch.frequency): batch
+                for batch in batches
+            }
+            for future in as_completed(futures):
+                batch = futures[future]
+                failed = False
+                try:
+                    parts = split_batch(batch, future.result())
+                except Exception as e:
+                    st.error(f"Error fetching data from TCMB: {e}")
+                    parts, failed = {}, True
+                for req in batch.requests:
+                    indicator = INDICATORS[req.name]
+                    raw = parts.get(req.name, pd.DataFrame())
+                    complete = not failed
+                    if indicator.base_periods and not raw.empty:
+                        try:
+                            raw = self._with_base_history(indicator, indicator.select(), raw, start_date)
+                        except Exception as e:
+                            st.error(f"Error fetching {indicator.label}: {e}")
+                            complete = False
+                    df = self._slice_window(normalize(indicator, raw, indicator.select()), req.frequency, start_date, end_date)
+                    if self.shared is not None and complete:
+                        ttl = min(shared_ttls[req.name], self._shared_ttl(req.name, start_date, end_date))
+                        self._shared_set(frame_key(req.name, start_date, end_date), df, ttl)
+                    yield req.name, df
+
+    @staticmethod
+    def _slice_window(df: pd.DataFrame, frequency: int, start_date: str, end_date: str) -> pd.DataFrame:
+        """
+        Cut an indicator back to its own window after it was fetched as part of a wider batch.
+        """
+        if "Date" not in df.columns:
+            return df
+        start = pd.to_datetime(start_date, format=DATE_FMT)
+        end = pd.to_datetime(end_date, format=DATE_FMT)
+        start = period_start(start, frequency)
+        return df[(df["Date"] >= start) & (df["Date"] <= end)]
+
+    def fetch_indicators(self, start_date: str, end_date: str, indicators: list = None) -> dict:
+        """
+        Fetch several indicators in parallel and return them together as {name: DataFrame}.
+        """
+        return dict(self.iter_indicators(start_date, end_date, indicators))
+    
+    def get_exchange_rates(self, start_date: str, end_date: str, currencies: list = ["USD", "EUR"], rate: str = "buying") -> pd.DataFrame:
+        """
+        Fetch exchange rates from TCMB.
+
+        Only the requested currencies and rate type are fetched (see get_fx_panel).
+        """
+        if not self.api_key:
+            st.error("TCMB API Key is missing. Please set TCMB_API_KEY in .env file.")
+            return pd.DataFrame()
+        columns = [fx_column(currency, rate) for currency in currencies]
+        return self.get_fx_panel(start_date, end_date, columns).project(columns)
+
+    def get_fx_panel(self, start_date: str, end_date: str, columns: list = None) -> ColumnarPanel:
+        """
+        TCMB FX panel as a ColumnarPanel: the given columns (see registry.fx_column), or every
+        quoted currency and rate type. Pages load just the selection on screen, so a retired or
+        failing code only breaks the pages that ask for it.
+
+        Series:
+        - TP.DK.{CUR}.A / TP.DK.{CUR}.S: Forex buying / selling rate, for every quoted currency
+        - TP.DK.{CUR}.A.EF / TP.DK.{CUR}.S.EF: Effective (banknote) buying / selling rate, where quoted
+        """
+        return self.get_panel("fx", start_date, end_date, columns)
 
-    @st.cache_data(ttl=3600)
-    def get_cpi_data(_self, start_date: str, end_date: str) -> pd.DataFrame:
+    def get_cpi_data(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
         Fetch CPI (Consumer Price Index) data from TCMB/TUIK and calculate rates.
         
@@ -113,211 +654,27 @@ class TCMBClient:
         - Inflation (YoY): (Index_t / Index_{t-12} - 1) * 100
         - Inflation (MoM): (Index_t / Index_{t-1} - 1) * 100
         """
-        if not _self.api_key:
-            return pd.DataFrame()
-
-        series_map = {
-            "CPI_Index": "TP.FG.J0"
-        }
-        
-        series_str = "-".join(series_map.values())
-        
-        try:
-            date_fmt = "%d-%m-%Y"
-            s = datetime.strptime(start_date, date_fmt)
-            s_prev = s - timedelta(days=550) 
-            start_date_extended = s_prev.strftime(date_fmt)
-        except:
-            start_date_extended = start_date
+        return self._get("cpi", start_date, end_date)
 
-        params = {
-            "series": series_str,
-            "startDate": start_date_extended,
-            "endDate": end_date,
-            "type": "json",
-            "frequency": 5
-        }
-        
-        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
-        base_api_url = "https://evds3.tcmb.gov.tr/igmevdsms-dis"
-        url = f"{base_api_url}/{query_string}"
-        
-        headers = {
-            "key": _self.api_key,
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        
-        try:
-            response = _self.session.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            
-            if "items" not in data:
-                return pd.DataFrame()
-                
-            df = pd.DataFrame(data["items"])
-            
-            if "Tarih" in df.columns:
-                df["Date"] = pd.to_datetime(df["Tarih"] + "-01", format="%Y-%m-%d", errors='coerce')
-                if df["Date"].isna().any():
-                     df["Date"] = pd.to_datetime(df["Tarih"], format="%d-%m-%Y", errors='coerce')
-
-            rename_dict = {}
-            for k, v in series_map.items():
-                api_key_name = v.replace(".", "_")
-                if api_key_name in df.columns:
-                    rename_dict[api_key_name] = k
-            
-            df.rename(columns=rename_dict, inplace=True)
-            
-            if "CPI_Index" in df.columns:
-                df["CPI_Index"] = pd.to_numeric(df["CPI_Index"], errors='coerce')
-                
-                df = df.sort_values("Date").reset_index(drop=True)
-                
-                df["CPI_Annual"] = df["CPI_Index"].pct_change(periods=12) * 100
-                df["CPI_Monthly"] = df["CPI_Index"].pct_change(periods=1) * 100
-            
-            req_start = pd.to_datetime(start_date, format="%d-%m-%Y")
-            df = df[df["Date"] >= req_start]
-
-            return df
-            
-        except Exception as e:
-            st.error(f"Error fetching CPI data: {str(e)}")
-            return pd.DataFrame()
-    @st.cache_data(ttl=3600)
-    def get_interest_rates(_self, start_date: str, end_date: str) -> pd.DataFrame:
+    def get_interest_rates(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
         Fetch Policy Rate / Weighted Average Funding Cost.
         
         Series:
         - TP.APIFON4: Weighted Average Funding Cost (Used as proxy for Policy Rate due to TP.PY.P01 restriction)
         """
-        if not _self.api_key:
-            return pd.DataFrame()
+        return self._get("interest", start_date, end_date)
 
-        series_map = {
-            "Policy_Rate": "TP.APIFON4"
-        }
-        
-        series_str = "-".join(series_map.values())
-        
-        params = {
-            "series": series_str,
-            "startDate": start_date,
-            "endDate": end_date,
-            "type": "json"
-        }
-        
-        params_no_key = {k: v for k, v in params.items() if k != "key"}
-        query_string = "&".join([f"{k}={v}" for k, v in params_no_key.items()])
-        base_api_url = "https://evds3.tcmb.gov.tr/igmevdsms-dis"
-        url = f"{base_api_url}/{query_string}"
-        
-        headers = {
-            "key": _self.api_key,
-            "User-Agent": "Mozilla/5.0"
-        }
-        
-        try:
-            response = _self.session.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            
-            if "items" not in data:
-                return pd.DataFrame()
-                
-            df = pd.DataFrame(data["items"])
-            
-            if "Tarih" in df.columns:
-                df["Date"] = pd.to_datetime(df["Tarih"], format="%d-%m-%Y")
-            
-            rename_dict = {}
-            for k, v in series_map.items():
-                api_key_name = v.replace(".", "_")
-                if api_key_name in df.columns:
-                    rename_dict[api_key_name] = k
-                    
-            df.rename(columns=rename_dict, inplace=True)
-            
-            if "Policy_Rate" in df.columns:
-                df["Policy_Rate"] = pd.to_numeric(df["Policy_Rate"], errors='coerce')
-                
-            df = df.dropna(subset=["Policy_Rate"])
-            
-            return df.sort_values("Date")
-            
-        except Exception as e:
-            st.error(f"Error fetching Interest Rates: {e}")
-            return pd.DataFrame()
-
-    @st.cache_data(ttl=3600)
-    def get_production_data(_self, start_date: str, end_date: str) -> pd.DataFrame:
+    def get_production_data(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
         Fetch Real Sector / Production Data.
         
         Series:
         - TP.KKO.MA: Capacity Utilization Rate of Manufacturing Industry (Weighted Average)
         """
-        if not _self.api_key:
-            return pd.DataFrame()
+        return self._get("production", start_date, end_date)
 
-        series_map = {
-            "Capacity_Utilization": "TP.KKO.MA"
-        }
-        
-        series_str = "-".join(series_map.values())
-        
-        params = {
-            "series": series_str,
-            "startDate": start_date,
-            "endDate": end_date,
-            "type": "json"
-        }
-        
-        params_no_key = {k: v for k, v in params.items() if k != "key"}
-        query_string = "&".join([f"{k}={v}" for k, v in params_no_key.items()])
-        base_api_url = "https://evds3.tcmb.gov.tr/igmevdsms-dis"
-        url = f"{base_api_url}/{query_string}"
-        
-        headers = {
-            "key": _self.api_key,
-            "User-Agent": "Mozilla/5.0"
-        }
-        
-        try:
-            response = _self.session.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            
-            if "items" not in data:
-                return pd.DataFrame()
-                
-            df = pd.DataFrame(data["items"])
-            
-            if "Tarih" in df.columns:
-                df["Date"] = pd.to_datetime(df["Tarih"], format="%Y-%m")
-            
-            rename_dict = {}
-            for k, v in series_map.items():
-                api_key_name = v.replace(".", "_")
-                if api_key_name in df.columns:
-                    rename_dict[api_key_name] = k
-                    
-            df.rename(columns=rename_dict, inplace=True)
-            
-            if "Capacity_Utilization" in df.columns:
-                df["Capacity_Utilization"] = pd.to_numeric(df["Capacity_Utilization"], errors='coerce')
-                
-            return df.sort_values("Date")
-            
-        except Exception as e:
-            st.error(f"Error fetching Production Data: {e}")
-            return pd.DataFrame()
-
-    @st.cache_data(ttl=3600)
-    def get_labor_data(_self, start_date: str, end_date: str) -> pd.DataFrame:
+    def get_labor_data(self, start_date: str, end_date: str) -> pd.DataFrame:
         """
         Fetch Labor Market Data.
         
@@ -325,60 +682,40 @@ class TCMBClient:
         - TP.TIG08: Unemployment Rate (%)
         - TP.TIG07: Labor Force Participation Rate (%)
         """
-        if not _self.api_key:
-            return pd.DataFrame()
+        return self._get("labor", start_date, end_date)
 
-        series_map = {
-            "Unemployment_Rate": "TP.TIG08",
-            "Participation_Rate": "TP.TIG07"
-        }
-        
-        series_str = "-".join(series_map.values())
-        
-        params = {
-            "series": series_str,
-            "startDate": start_date,
-            "endDate": end_date,
-            "type": "json"
-        }
-        
-        params_no_key = {k: v for k, v in params.items() if k != "key"}
-        query_string = "&".join([f"{k}={v}" for k, v in params_no_key.items()])
-        base_api_url = "https://evds3.tcmb.gov.tr/igmevdsms-dis"
-        url = f"{base_api_url}/{query_string}"
-        
-        headers = {
-            "key": _self.api_key,
-            "User-Agent": "Mozilla/5.0"
-        }
-        
-        try:
-            response = _self.session.get(url, headers=headers, timeout=15)
-            response.raise_for_status()
-            data = response.json()
-            
-            if "items" not in data:
-                return pd.DataFrame()
-                
-            df = pd.DataFrame(data["items"])
-            
-            if "Tarih" in df.columns:
-                df["Date"] = pd.to_datetime(df["Tarih"], format="%Y-%m")
-            
-            rename_dict = {}
-            for k, v in series_map.items():
-                api_key_name = v.replace(".", "_")
-                if api_key_name in df.columns:
-                    rename_dict[api_key_name] = k
-                    
-            df.rename(columns=rename_dict, inplace=True)
-            
-            for col in ["Unemployment_Rate", "Participation_Rate"]:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                
-            return df.sort_values("Date")
-            
-        except Exception as e:
-            st.error(f"Error fetching Labor Data: {e}")
-            return pd.DataFrame()
+def memory_report() -> pd.DataFrame:
+    """
+    Bytes held per cached series in this process: raw observations in the shared interval
+    cache, the normalized frames st.cache_data keeps per fetch function, and the columnar
+    panels st.cache_resource keeps per indicator range.
+    """
+    rows = []
+    for (code, frequency), (count, nbytes) in SHARED_INTERVALS.memory_usage().items():
+        rows.append({"cache": "intervals", "series": code, "frequency": frequency, "rows": count, "bytes": nbytes})
+
+    stats = get_data_cache_stats_provider().get_stats()
+    if isinstance(stats, dict):
+        stats = [stat for family in stats.values() for stat in family]
+    per_function = {}
+    for stat in stats:
+        per_function[stat.cache_name] = per_function.get(stat.cache_name, 0) + stat.byte_length
+    for name, nbytes in per_function.items():
+        rows.append({"cache": "st.cache_data", "series": name, "frequency": None, "rows": None, "bytes": nbytes})
+
+    for (name, start_date, end_date, columns), panel in list(_live_panels.items()):
+        rows.append({
+            "cache": "st.cache_resource", "series": f"{name} {start_date}..{end_date} ({len(columns)} series)",
+            "frequency": INDICATORS[name].frequency, "rows": len(panel), "bytes": panel.nbytes,
+        })
+
+    return pd.DataFrame(rows, columns=["cache", "series", "frequency", "rows", "bytes"])
+
+@st.cache_resource
+def get_client() -> TCMBClient:
+    """
+    Process-wide TCMBClient shared by every session and page.
+    Reusing one Session keeps its pooled connections alive, so the legacy-cipher TLS handshake
+    happens once per connection instead of on every rerun.
+    """
+    return TCMBClient()
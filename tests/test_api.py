@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+import requests
+from tools.api import etag_matches, serve
+
+
+class FakeClient:
+    """
+    Stands in for TCMBClient: serves a fixed frame and records what was asked for.
+    """
+    def __init__(self):
+        self.calls = []
+
+    def fetch_shared(self, name, start_date, end_date, columns=None):
+        self.calls.append((name, start_date, end_date, columns))
+        return pd.DataFrame({
+            "Date": pd.to_datetime(["2025-01-02", "2025-01-03"]),
+            "USD": pd.Series([35.3756, 35.41], dtype="float32"),
+        })
+
+
+@pytest.fixture
+def api():
+    client = FakeClient()
+    server = serve(port=0, client=client)
+    yield f"http://127.0.0.1:{server.server_address[1]}", client
+    server.shutdown()
+    server.server_close()
+
+
+def test_series_response_carries_etag_and_repeats_get_304(api):
+    url, client = api
+    first = requests.get(f"{url}/series/fx?start=2025-01-01&end=2025-01-31&columns=USD")
+    assert first.status_code == 200
+    assert first.json()["data"] == [{"Date": "2025-01-02", "USD": 35.3756}, {"Date": "2025-01-03", "USD": 35.41}]
+    assert client.calls == [("fx", "01-01-2025", "31-01-2025", ["USD"])]
+
+    etag = first.headers["ETag"]
+    again = requests.get(f"{url}/series/fx?start=2025-01-01&end=2025-01-31&columns=USD", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == etag
+
+
+def test_changed_etag_gets_the_full_body(api):
+    url, _ = api
+    response = requests.get(f"{url}/series/fx?start=2025-01-01&end=2025-01-31", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json()["columns"] == ["USD"]
+
+
+def test_bad_requests_are_rejected_with_400(api):
+    url, client = api
+    unknown = requests.get(f"{url}/series/fx?columns=XYZ")
+    assert unknown.status_code == 400
+    assert "XYZ" in unknown.json()["error"]
+    assert requests.get(f"{url}/series/fx?start=2025-02-01&end=2025-01-01").status_code == 400
+    assert requests.get(f"{url}/series/fx?start=01-01-2025").status_code == 400
+    assert requests.get(f"{url}/series/fx?format=xml").status_code == 400
+    assert requests.get(f"{url}/series/gdp").status_code == 404
+    assert client.calls == []
+
+
+def test_etag_matches_uses_weak_comparison():
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"abcd"', '"abc"')
+    assert not etag_matches(None, '"abc"')
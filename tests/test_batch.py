@@ -0,0 +1,91 @@
+from datetime import datetime
+import pandas as pd
+from data.fetchers.batch import SeriesRequest, plan_batches, split_batch, split_window
+
+D = datetime
+
+
+def test_plan_batches_merges_overlapping_windows_per_frequency():
+    batches = plan_batches([
+        SeriesRequest("fx", ["TP.DK.USD.A", "TP.DK.EUR.A"], 1, D(2024, 1, 1), D(2024, 6, 30)),
+        SeriesRequest("interest", ["TP.APIFON4"], 1, D(2024, 3, 1), D(2024, 9, 30)),
+        SeriesRequest("cpi", ["TP.FG.J0"], 5, D(2023, 1, 1), D(2024, 9, 30)),
+    ])
+    daily, monthly = batches
+    assert (daily.frequency, daily.start, daily.end) == (1, D(2024, 1, 1), D(2024, 9, 30))
+    assert daily.codes == ["TP.DK.USD.A", "TP.DK.EUR.A", "TP.APIFON4"]
+    assert (daily.start_str, daily.end_str) == ("01-01-2024", "30-09-2024")
+    assert [req.name for req in monthly.requests] == ["cpi"]
+
+
+def test_plan_batches_keeps_disjoint_windows_apart():
+    batches = plan_batches([
+        SeriesRequest("labor", ["TP.TIG08"], 5, D(2024, 6, 1), D(2024, 9, 30)),
+        SeriesRequest("production", ["TP.KKO.MA"], 5, D(2020, 1, 1), D(2020, 12, 31)),
+    ])
+    assert [(b.start, b.end) for b in batches] == [(D(2020, 1, 1), D(2020, 12, 31)), (D(2024, 6, 1), D(2024, 9, 30))]
+
+
+def test_plan_batches_lists_shared_codes_once():
+    batches = plan_batches([
+        SeriesRequest("a", ["TP.DK.USD.A"], 1, D(2024, 1, 1), D(2024, 1, 31)),
+        SeriesRequest("b", ["TP.DK.USD.A", "TP.DK.EUR.A"], 1, D(2024, 1, 15), D(2024, 2, 15)),
+    ])
+    assert batches[0].codes == ["TP.DK.USD.A", "TP.DK.EUR.A"]
+
+
+def test_split_batch_gives_each_indicator_its_own_columns():
+    batch = plan_batches([
+        SeriesRequest("fx", ["TP.DK.USD.A", "TP.DK.EUR.A"], 1, D(2024, 1, 1), D(2024, 1, 2)),
+        SeriesRequest("interest", ["TP.APIFON4"], 1, D(2024, 1, 1), D(2024, 1, 2)),
+    ])[0]
+    df = pd.DataFrame({
+        "Date": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+        "TP_DK_USD_A": [29.5, 29.6],
+        "TP_DK_EUR_A": [32.6, 32.7],
+        "TP_APIFON4": [42.5, 42.5],
+    })
+    parts = split_batch(batch, df)
+    assert list(parts["fx"].columns) == ["Date", "TP_DK_USD_A", "TP_DK_EUR_A"]
+    assert list(parts["interest"].columns) == ["Date", "TP_APIFON4"]
+    assert parts["interest"]["TP_APIFON4"].tolist() == [42.5, 42.5]
+
+
+def test_split_batch_skips_missing_codes_and_empty_frames():
+    batch = plan_batches([SeriesRequest("fx", ["TP.DK.USD.A", "TP.DK.GBP.A"], 1, D(2024, 1, 1), D(2024, 1, 1))])[0]
+    df = pd.DataFrame({"Date": pd.to_datetime(["2024-01-01"]), "TP_DK_USD_A": [29.5]})
+    assert list(split_batch(batch, df)["fx"].columns) == ["Date", "TP_DK_USD_A"]
+    assert split_batch(batch, pd.DataFrame()) == {}
+
+
+def test_split_window_covers_range_without_gaps():
+    windows = split_window(D(2020, 1, 1), D(2024, 12, 31), 365)
+    assert windows[0][0] == D(2020, 1, 1)
+    assert windows[-1][1] == D(2024, 12, 31)
+    for (_, end), (start, _) in zip(windows, windows[1:]):
+        assert (start - end).days == 1
+    assert all((end - start).days < 365 for start, end in windows)
+
+
+def test_split_window_short_range_is_one_window():
+    assert split_window(D(2024, 1, 5), D(2024, 1, 20), 365) == [(D(2024, 1, 5), D(2024, 1, 20))]
+
+
+def test_split_window_monthly_windows_start_on_first_of_month():
+    windows = split_window(D(2020, 1, 1), D(2024, 12, 31), 400, monthly=True)
+    assert all(start.day == 1 for start, _ in windows)
+    for (_, end), (start, _) in zip(windows, windows[1:]):
+        assert (start - end).days == 1
+    assert windows[-1][1] == D(2024, 12, 31)
+
+
+def test_split_window_monthly_never_shorter_than_a_month():
+    windows = split_window(D(2024, 1, 1), D(2024, 6, 30), 10, monthly=True)
+    assert windows == [
+        (D(2024, 1, 1), D(2024, 1, 31)),
+        (D(2024, 2, 1), D(2024, 2, 29)),
+        (D(2024, 3, 1), D(2024, 3, 31)),
+        (D(2024, 4, 1), D(2024, 4, 30)),
+        (D(2024, 5, 1), D(2024, 5, 31)),
+        (D(2024, 6, 1), D(2024, 6, 30)),
+    ]
@@ -0,0 +1,53 @@
+import json
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+from data.fetchers.decode import decode_items
+
+# Turkey has been on UTC+3 all year since 2016
+ISTANBUL = timezone(timedelta(hours=3))
+
+
+def _content(items: list) -> bytes:
+    return json.dumps({"totalCount": len(items), "items": items}).encode()
+
+
+def _unixtime(moment: datetime) -> dict:
+    return {"$numberLong": str(int(moment.timestamp()))}
+
+
+def test_unixtime_local_midnight_decodes_to_its_istanbul_day():
+    # Local midnight on 1 January is still 31 December in UTC
+    items = [{"Tarih": "01-01-2024", "TP_DK_USD_A": "29.4382", "UNIXTIME": _unixtime(datetime(2024, 1, 1, tzinfo=ISTANBUL))}]
+    df = decode_items(_content(items), ["TP.DK.USD.A"])
+    assert df["Date"].tolist() == [pd.Timestamp("2024-01-01")]
+    assert df["Date"].dtype == "datetime64[ns]"
+
+
+def test_unixtime_off_midnight_rounds_to_the_nearest_day():
+    midnight = datetime(2024, 3, 15, tzinfo=ISTANBUL)
+    items = [
+        {"TP_DK_USD_A": "32.1", "UNIXTIME": _unixtime(midnight + timedelta(hours=3))},
+        {"TP_DK_USD_A": "32.2", "UNIXTIME": _unixtime(midnight + timedelta(days=1) - timedelta(hours=3))},
+    ]
+    df = decode_items(_content(items), ["TP.DK.USD.A"])
+    assert df["Date"].tolist() == [pd.Timestamp("2024-03-15"), pd.Timestamp("2024-03-16")]
+
+
+def test_tarih_is_parsed_when_unixtime_is_missing():
+    items = [{"Tarih": "2024-1", "TP_FG_J0": "1984.02"}, {"Tarih": "2024-2", "TP_FG_J0": "2073.90"}]
+    df = decode_items(_content(items), ["TP.FG.J0"])
+    assert df["Date"].tolist() == [pd.Timestamp("2024-01-01"), pd.Timestamp("2024-02-01")]
+
+
+def test_values_decode_to_float64_with_nulls_as_nan():
+    stamp = _unixtime(datetime(2024, 1, 1, tzinfo=ISTANBUL))
+    items = [{"TP_DK_USD_A": "29.4382", "TP_DK_EUR_A": None, "EXTRA": "x", "UNIXTIME": stamp}]
+    df = decode_items(_content(items), ["TP.DK.USD.A", "TP.DK.EUR.A", "TP.DK.GBP.A"])
+    assert list(df.columns) == ["Date", "TP_DK_USD_A", "TP_DK_EUR_A"]
+    assert df["TP_DK_USD_A"].dtype == np.float64
+    assert np.isnan(df["TP_DK_EUR_A"].iloc[0])
+
+
+def test_empty_response_decodes_to_empty_frame():
+    assert decode_items(_content([]), ["TP.DK.USD.A"]).empty
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+from data.fetchers.derived import Derived, apply_derived, real_policy_rate
+from data.fetchers.registry import INDICATORS
+
+
+def cpi_frame(months: int) -> pd.DataFrame:
+    dates = pd.date_range("2015-01-01", periods=months, freq="MS")
+    index = 100 * np.cumprod(1 + np.random.default_rng(0).uniform(0, 0.04, months))
+    return pd.DataFrame({"Date": dates, "CPI_Index": index})
+
+
+def test_cpi_derivations_match_pandas():
+    df = cpi_frame(60)
+    out = apply_derived(df, INDICATORS["cpi"].derived)
+    pd.testing.assert_series_equal(out["CPI_Annual"], df["CPI_Index"].pct_change(12) * 100, check_names=False)
+    pd.testing.assert_series_equal(out["CPI_Monthly"], df["CPI_Index"].pct_change(1) * 100, check_names=False)
+
+
+def test_windows_skip_rows_without_observations():
+    df = cpi_frame(6)
+    df.loc[2, "CPI_Index"] = np.nan
+    out = apply_derived(df, (Derived("Change", "CPI_Index", "pct_change", 1),))
+    assert np.isnan(out["Change"][2])
+    assert out["Change"][3] == (df["CPI_Index"][3] / df["CPI_Index"][1] - 1) * 100
+
+
+def test_moving_average_and_volatility_match_pandas():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"Date": pd.date_range("2024-01-01", periods=120), "USD": 30 + rng.normal(0, 0.1, 120).cumsum()})
+    out = apply_derived(df, (Derived("MA", "USD", "moving_average", 20), Derived("Vol", "USD", "volatility", 10)))
+    pd.testing.assert_series_equal(out["MA"], df["USD"].rolling(20).mean(), check_names=False)
+    expected = np.log(df["USD"]).diff().rolling(10).std() * np.sqrt(252) * 100
+    pd.testing.assert_series_equal(out["Vol"], expected, check_names=False)
+
+
+def test_derived_columns_without_source_are_skipped():
+    df = cpi_frame(3)
+    assert apply_derived(df, (Derived("MA", "USD", "moving_average", 2),)) is df
+
+
+def test_real_policy_rate_uses_latest_cpi_on_or_before_each_date():
+    cpi = pd.DataFrame({"Date": pd.to_datetime(["2024-01-01", "2024-02-01"]), "CPI_Annual": [64.9, 67.1]})
+    interest = pd.DataFrame({"Date": pd.to_datetime(["2023-12-29", "2024-01-15", "2024-02-20"]), "Policy_Rate": [42.5, 45.0, 45.0]})
+    out = real_policy_rate(interest, cpi)
+    assert np.isnan(out["Real_Policy_Rate"][0])
+    np.testing.assert_allclose(out["Real_Policy_Rate"][1:], [45.0 - 64.9, 45.0 - 67.1])
+
+
+def test_real_policy_rate_without_cpi_is_empty():
+    interest = pd.DataFrame({"Date": pd.to_datetime(["2024-01-15"]), "Policy_Rate": [45.0]})
+    assert real_policy_rate(interest, pd.DataFrame()).empty
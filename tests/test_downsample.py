@@ -0,0 +1,30 @@
+import numpy as np
+from components.downsample import lttb, minmax
+
+
+def test_lttb_keeps_endpoints_and_count():
+    x = np.arange(1000)
+    y = np.sin(x / 25.0)
+    indices = lttb(x, y, 100)
+    assert len(indices) == 100
+    assert indices[0] == 0
+    assert indices[-1] == 999
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_keeps_a_single_spike():
+    x = np.arange(500)
+    y = np.zeros(500)
+    y[321] = 10.0
+    assert 321 in lttb(x, y, 50)
+
+
+def test_lttb_below_threshold_keeps_every_point():
+    x = np.arange(10)
+    assert np.array_equal(lttb(x, x * 2.0, 50), x)
+
+
+def test_minmax_keeps_extremes_and_endpoints():
+    y = np.random.default_rng(0).normal(size=1000)
+    indices = minmax(y, 100)
+    assert {0, 999, int(y.argmin()), int(y.argmax())} <= set(indices.tolist())
@@ -0,0 +1,20 @@
+from benchmarks.imports import LAZY_MODULES, probe, startup_modules
+
+# Far above the CLI's default 1.5s budget, so slow CI machines do not flake while a regression
+# that pulls the fetchers or chart libraries back into startup still fails
+BUDGET_SECONDS = 5.0
+
+
+def test_startup_modules_are_read_from_app():
+    modules = startup_modules()
+    assert "streamlit" in modules
+    assert not [m for m in modules if m in LAZY_MODULES]
+
+
+def test_startup_imports_no_chart_library_and_stays_within_budget():
+    result = probe()
+    # streamlit itself loads plotly's core, so check for the chart libraries the pages use
+    assert "plotly.express" not in result["loaded"]
+    assert "altair" not in result["loaded"]
+    assert "data.fetchers.tcmb" not in result["loaded"]
+    assert result["seconds"] < BUDGET_SECONDS
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+import pandas as pd
+from data.fetchers.intervals import IntervalCache, missing_spans, trusted_spans
+
+D = datetime
+
+
+def test_missing_spans_returns_uncovered_edges():
+    spans = [(D(2024, 3, 1), D(2024, 3, 31)), (D(2024, 1, 1), D(2024, 1, 31))]
+    assert missing_spans(spans, D(2023, 12, 1), D(2024, 4, 30)) == [
+        (D(2023, 12, 1), D(2023, 12, 31)),
+        (D(2024, 2, 1), D(2024, 2, 29)),
+        (D(2024, 4, 1), D(2024, 4, 30)),
+    ]
+
+
+def test_missing_spans_merges_adjacent_spans():
+    spans = [(D(2024, 1, 1), D(2024, 1, 15)), (D(2024, 1, 16), D(2024, 1, 31))]
+    assert missing_spans(spans, D(2024, 1, 1), D(2024, 1, 31)) == []
+
+
+def test_missing_spans_without_spans_is_whole_range():
+    assert missing_spans([], D(2024, 1, 1), D(2024, 1, 31)) == [(D(2024, 1, 1), D(2024, 1, 31))]
+
+
+def test_trusted_spans_keeps_fresh_spans_whole():
+    fetched_at = D(2024, 6, 30).timestamp()
+    spans = [(D(2024, 1, 1), D(2024, 6, 30), fetched_at)]
+    assert trusted_spans(spans, ttl=3600, revision_days=7, now=fetched_at + 60) == [(D(2024, 1, 1), D(2024, 6, 30))]
+
+
+def test_trusted_spans_trims_revision_edge_of_expired_spans():
+    fetched_at = D(2024, 6, 30).timestamp()
+    spans = [(D(2024, 1, 1), D(2024, 6, 30), fetched_at)]
+    assert trusted_spans(spans, ttl=3600, revision_days=7, now=fetched_at + 3600) == [(D(2024, 1, 1), D(2024, 6, 23))]
+
+
+def test_trusted_spans_drops_expired_spans_inside_revision_window():
+    fetched_at = D(2024, 6, 30).timestamp()
+    spans = [(D(2024, 6, 25), D(2024, 6, 30), fetched_at)]
+    assert trusted_spans(spans, ttl=3600, revision_days=7, now=fetched_at + 3600) == []
+
+
+def _frame(start, days):
+    dates = pd.date_range(start, periods=days, freq="D")
+    return pd.DataFrame({"Date": dates, "TP_DK_USD_A": range(days)})
+
+
+def test_interval_cache_serves_stale_spans_only_when_allowed():
+    cache = IntervalCache(ttl=3600, revision_days={1: 7})
+    end = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = end - timedelta(days=29)
+    cache.put(_frame(start, 30), ["TP.DK.USD.A"], 1, start, end, fetched_at=0)
+
+    assert cache.missing(["TP.DK.USD.A"], 1, start, end, stale_ok=True) == {"TP.DK.USD.A": []}
+    assert cache.missing(["TP.DK.USD.A"], 1, start, end) == {"TP.DK.USD.A": [(start, end)]}
+    assert cache.fresh_for(["TP.DK.USD.A"], 1, start, end) == 0
+
+
+def test_fresh_for_ignores_expiries_covered_by_newer_spans():
+    cache = IntervalCache(ttl=3600, revision_days={1: 7})
+    end = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = end - timedelta(days=29)
+    now = datetime.now().timestamp()
+    cache.put(_frame(start, 30), ["TP.DK.USD.A"], 1, start, end, fetched_at=now - 7200)
+    edge = end - timedelta(days=9)
+    cache.put(_frame(edge, 10), ["TP.DK.USD.A"], 1, edge, end, fetched_at=now - 600)
+
+    assert 2990 < cache.fresh_for(["TP.DK.USD.A"], 1, start, end, now=now) <= 3000
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from data.fetchers.panel import ColumnarPanel
+
+
+def _panel():
+    dates = pd.date_range("2024-01-01", periods=10, freq="D")
+    df = pd.DataFrame({
+        "Date": dates[::-1],
+        "USD": np.arange(10, dtype=np.float32)[::-1],
+        "EUR": np.arange(10, 20, dtype=np.float32)[::-1],
+        "GBP": np.arange(20, 30, dtype=np.float32)[::-1],
+    })
+    return ColumnarPanel.from_frame(df)
+
+
+def test_from_frame_sorts_by_date():
+    panel = _panel()
+    assert panel.columns == ["USD", "EUR", "GBP"]
+    assert panel.data["USD"].tolist() == list(range(10))
+    assert np.all(np.diff(panel.dates) > np.timedelta64(0))
+
+
+def test_project_selects_columns_and_dates_without_copying():
+    panel = _panel()
+    df = panel.project(["EUR", "XYZ"], "2024-01-03", "2024-01-05")
+    assert list(df.columns) == ["Date", "EUR"]
+    assert df["EUR"].tolist() == [12, 13, 14]
+    assert df["Date"].tolist() == list(pd.date_range("2024-01-03", "2024-01-05"))
+    assert np.shares_memory(df["EUR"].to_numpy(), panel.data["EUR"])
+    assert np.shares_memory(df["Date"].to_numpy(), panel.dates)
+
+
+def test_panel_arrays_are_read_only():
+    panel = _panel()
+    with pytest.raises(ValueError):
+        panel.data["USD"][0] = 1.0
+
+
+def test_project_defaults_to_every_column_and_date():
+    panel = _panel()
+    df = panel.project()
+    assert list(df.columns) == ["Date", "USD", "EUR", "GBP"]
+    assert len(df) == len(panel) == 10
+
+
+def test_empty_panel_projects_to_empty_frame():
+    panel = ColumnarPanel.from_frame(pd.DataFrame())
+    assert panel.empty
+    assert panel.project(["USD"]).empty
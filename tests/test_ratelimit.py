@@ -0,0 +1,46 @@
+import threading
+import time
+from data.fetchers.ratelimit import LocalBucket, RateLimiter, current_lane, lane
+
+
+def _wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def test_interactive_requests_go_before_queued_background_ones():
+    limiter = RateLimiter(LocalBucket(rate=5, burst=1))
+    limiter.acquire()  # drain the bucket so every later caller queues
+    order = []
+
+    def call(name):
+        limiter.acquire(name)
+        order.append(name)
+
+    threads = []
+    for name in ("background", "background", "interactive"):
+        thread = threading.Thread(target=call, args=(name,))
+        thread.start()
+        threads.append(thread)
+        # Queue them in this order
+        _wait_for(lambda: limiter.waiting() == len(threads))
+    for thread in threads:
+        thread.join()
+
+    assert order[0] == "interactive"
+    assert order[1:] == ["background", "background"]
+
+
+def test_bucket_allows_burst_then_waits():
+    bucket = LocalBucket(rate=1, burst=3)
+    assert [bucket.take() for _ in range(3)] == [0, 0, 0]
+    assert bucket.take() > 0
+
+
+def test_lane_context_restores_previous_lane():
+    assert current_lane() == "interactive"
+    with lane("background"):
+        assert current_lane() == "background"
+    assert current_lane() == "interactive"
@@ -0,0 +1,82 @@
+import time
+import pytest
+import requests
+from data.fetchers.resilience import CircuitBreaker, CircuitOpenError, call_with_retry
+
+
+def _http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status}", response=response)
+
+
+def _flaky(errors: list, result="ok"):
+    calls = []
+
+    def func():
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return result
+    return func, calls
+
+
+def test_breaker_opens_after_threshold_and_fails_fast():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_success_resets_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_breaker_lets_one_trial_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.state == "half-open"
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_failed_trial_opens_the_breaker_again():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0.05)
+    for _ in range(3):
+        breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+def test_call_with_retry_retries_transient_errors():
+    func, calls = _flaky([requests.ConnectionError(), _http_error(503)])
+    assert call_with_retry(func, attempts=3, base_delay=0) == "ok"
+    assert len(calls) == 3
+
+
+def test_call_with_retry_gives_up_after_the_last_attempt():
+    func, calls = _flaky([_http_error(429), _http_error(429), _http_error(429)])
+    with pytest.raises(requests.HTTPError):
+        call_with_retry(func, attempts=3, base_delay=0)
+    assert len(calls) == 3
+
+
+def test_call_with_retry_does_not_retry_client_errors():
+    func, calls = _flaky([_http_error(403)])
+    with pytest.raises(requests.HTTPError):
+        call_with_retry(func, attempts=3, base_delay=0)
+    assert len(calls) == 1
@@ -0,0 +1,56 @@
+import time
+import pandas as pd
+import pytest
+from data.fetchers.shared_cache import SQLiteCache, frame_key, indicator_prefix, open_shared_cache
+
+
+def _frame():
+    return pd.DataFrame({
+        "Date": pd.to_datetime(["2025-01-02", "2025-01-03"]),
+        "USD": pd.Series([35.3756, None], dtype="float32"),
+        "EUR": [36.7, 36.8],
+    })
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SQLiteCache(str(tmp_path / "shared.db"))
+
+
+def test_frame_round_trip_keeps_columns_and_dtypes(cache):
+    key = frame_key("fx", "01-01-2025", "31-01-2025", ["USD", "EUR"])
+    cache.set_frame(key, _frame(), ttl=60)
+    pd.testing.assert_frame_equal(cache.get_frame(key), _frame())
+
+
+def test_entries_expire_after_their_ttl(cache):
+    cache.set("a", b"1", ttl=0.05)
+    cache.set("b", b"2", ttl=60)
+    assert cache.get("a") == b"1"
+    time.sleep(0.06)
+    assert cache.get("a") is None
+    assert cache.get("b") == b"2"
+
+
+def test_clear_drops_only_the_prefix(cache):
+    fx = frame_key("fx", "01-01-2025", "31-01-2025")
+    cpi = frame_key("cpi", "01-01-2025", "31-01-2025")
+    cache.set(fx, b"fx", ttl=60)
+    cache.set(cpi, b"cpi", ttl=60)
+    cache.clear(indicator_prefix("fx"))
+    assert cache.get(fx) is None
+    assert cache.get(cpi) == b"cpi"
+
+
+def test_object_columns_and_unreadable_entries_are_skipped(cache):
+    cache.set_frame("text", pd.DataFrame({"Name": ["a"]}), ttl=60)
+    assert cache.get("text") is None
+    cache.set("junk", b"not an archive", ttl=60)
+    assert cache.get_frame("junk") is None
+
+
+def test_open_shared_cache_picks_sqlite_for_files(tmp_path):
+    assert open_shared_cache("") is None
+    cache = open_shared_cache(f"sqlite:///{tmp_path}/shared.db")
+    assert isinstance(cache, SQLiteCache)
+    assert cache.path == f"{tmp_path}/shared.db"
@@ -0,0 +1,62 @@
+import threading
+import pytest
+from data.fetchers.singleflight import SingleFlight
+
+
+def _concurrent(group, key, func, callers=5):
+    """
+    Run group.do(key, func) from several threads; returns each caller's result or exception.
+    """
+    results = [None] * callers
+    started = threading.Barrier(callers)
+
+    def call(i):
+        started.wait()
+        try:
+            results[i] = group.do(key, func)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def _blocking(release, calls, outcome):
+    def func():
+        calls.append(1)
+        release.wait(5)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    return func
+
+
+def test_concurrent_calls_share_one_result():
+    group = SingleFlight("test")
+    release, calls = threading.Event(), []
+    threading.Timer(0.2, release.set).start()
+    results = _concurrent(group, "k", _blocking(release, calls, {"rows": 3}))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_concurrent_calls_share_the_error():
+    group = SingleFlight("test")
+    release, calls = threading.Event(), []
+    error = RuntimeError("upstream down")
+    threading.Timer(0.2, release.set).start()
+    results = _concurrent(group, "k", _blocking(release, calls, error))
+    assert len(calls) == 1
+    assert all(result is error for result in results)
+    assert group.in_flight() == 0
+
+
+def test_calls_after_completion_run_again():
+    group = SingleFlight("test")
+    with pytest.raises(ValueError):
+        group.do("k", lambda: (_ for _ in ()).throw(ValueError("first")))
+    assert group.do("k", lambda: "second") == "second"
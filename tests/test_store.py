@@ -0,0 +1,68 @@
+import sqlite3
+from datetime import date, datetime, timedelta
+import pandas as pd
+from data.fetchers.store import SCHEMA_VERSION, SeriesStore
+
+D = datetime
+CODES = ["TP.DK.USD.A", "TP.DK.EUR.A"]
+
+
+def _frame():
+    return pd.DataFrame({
+        "Date": pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"]),
+        "TP_DK_USD_A": [29.5, None, 29.7],
+        "TP_DK_EUR_A": [32.6, 32.7, 32.8],
+    })
+
+
+def test_upsert_and_load_round_trip(tmp_path):
+    store = SeriesStore(str(tmp_path / "series.db"))
+    store.upsert(_frame(), CODES, 1)
+    df = store.load(CODES, 1, D(2024, 1, 2), D(2024, 1, 3))
+    assert df["Date"].tolist() == [pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-03")]
+    assert pd.isna(df["TP_DK_USD_A"].iloc[0])
+    assert df["TP_DK_EUR_A"].tolist() == [32.7, 32.8]
+
+
+def test_upsert_replaces_revised_values(tmp_path):
+    store = SeriesStore(str(tmp_path / "series.db"))
+    store.upsert(_frame(), CODES, 1)
+    store.upsert(pd.DataFrame({"Date": pd.to_datetime(["2024-01-03"]), "TP_DK_USD_A": [30.0]}), CODES, 1)
+    assert store.load(["TP.DK.USD.A"], 1, D(2024, 1, 3), D(2024, 1, 3))["TP_DK_USD_A"].tolist() == [30.0]
+
+
+def test_missing_reports_spans_outside_recorded_coverage(tmp_path):
+    store = SeriesStore(str(tmp_path / "series.db"))
+    store.record_coverage(CODES, 1, D(2024, 1, 1), D(2024, 3, 31))
+    gaps = store.missing(CODES + ["TP.DK.GBP.A"], 1, D(2024, 1, 1), D(2024, 4, 30), ttl=3600, revision_days=7)
+    assert gaps["TP.DK.USD.A"] == [(D(2024, 4, 1), D(2024, 4, 30))]
+    assert gaps["TP.DK.GBP.A"] == [(D(2024, 1, 1), D(2024, 4, 30))]
+    # Coverage is per frequency
+    assert store.missing(CODES, 5, D(2024, 1, 1), D(2024, 1, 31), 3600, 7)["TP.DK.USD.A"] == [(D(2024, 1, 1), D(2024, 1, 31))]
+
+
+def test_expired_coverage_refetches_revision_window(tmp_path):
+    store = SeriesStore(str(tmp_path / "series.db"))
+    end = D.combine(date.today(), D.min.time())
+    store.record_coverage(CODES, 1, end - timedelta(days=90), end)
+    gaps = store.missing(CODES, 1, end - timedelta(days=90), end, ttl=0, revision_days=7)
+    [(gap_start, gap_end)] = gaps["TP.DK.USD.A"]
+    assert gap_end == end
+    assert end - timedelta(days=7) < gap_start < end - timedelta(days=5)
+
+
+def test_outdated_schema_is_rebuilt(tmp_path):
+    path = str(tmp_path / "series.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE observations (code TEXT, date TEXT, value REAL)")
+    conn.execute("INSERT INTO observations VALUES ('TP.DK.USD.A', '2024-01-01', 1.0)")
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION - 1}")
+    conn.commit()
+    conn.close()
+
+    store = SeriesStore(path)
+    assert store.load(["TP.DK.USD.A"], 1, D(2024, 1, 1), D(2024, 1, 1)).empty
+    store.upsert(_frame(), CODES, 1)
+    assert len(store.load(CODES, 1, D(2024, 1, 1), D(2024, 1, 3))) == 3
+    with sqlite3.connect(path) as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
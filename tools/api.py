@@ -0,0 +1,231 @@
+"""
+Read-only HTTP API over the dashboard's normalized series.
+
+    python -m tools.api --port 8600
+
+    GET /series                                        indicators and their columns
+    GET /series/fx?start=2025-01-01&end=2025-06-30     JSON records
+    GET /series/fx.csv?columns=USD,EUR                 CSV (or ?format=csv, or Accept: text/csv)
+    GET /metrics                                       Prometheus metrics of this process
+
+Series are served through TCMBClient, i.e. from the shared cache (SHARED_CACHE_URL), the interval
+cache and the local series store, so API pollers and dashboard workers share each upstream fetch
+and EVDS is only asked for what none of them holds yet. start/end default to the last year.
+Responses carry an ETag and honour If-None-Match (304), and are gzipped when the client accepts it.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import numpy as np
+import pandas as pd
+from data.fetchers.metrics import METRICS
+from data.fetchers.registry import INDICATORS
+from data.fetchers.resilience import CircuitOpenError
+from data.fetchers.tcmb import DATE_FMT, TCMBClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DAYS = 365
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_BYTES = 1024
+MAX_AGE_SECONDS = 60
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def catalog() -> dict:
+    return {
+        "series": [
+            {
+                "name": name,
+                "label": indicator.label,
+                "frequency": indicator.frequency,
+                "columns": [spec.column for spec in indicator.series],
+                "default_columns": list(indicator.default_columns) or [spec.column for spec in indicator.series],
+            }
+            for name, indicator in INDICATORS.items()
+        ]
+    }
+
+
+def parse_day(value: str, default: date) -> date:
+    if not value:
+        return default
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise ApiError(400, f"dates must be YYYY-MM-DD, got {value!r}")
+
+
+def records(df: pd.DataFrame) -> list:
+    """
+    Row dicts with NaN as null. float32 columns go through their shortest repr, so a rate stored
+    as 35.3756 is sent as 35.3756 rather than 35.37559890747.
+    """
+    columns = {}
+    for column in df.columns:
+        values = df[column].to_numpy()
+        if values.dtype == np.float32:
+            columns[column] = [None if v == "nan" else float(v) for v in values.astype(str)]
+        else:
+            columns[column] = [None if pd.isna(v) else v for v in values.tolist()]
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+def series_body(client: TCMBClient, name: str, query: dict, fmt: str) -> tuple:
+    """
+    (body bytes, content type) for one indicator over the requested range and columns.
+    """
+    indicator = INDICATORS.get(name)
+    if indicator is None:
+        raise ApiError(404, f"unknown series {name!r}")
+
+    end = parse_day(query.get("end"), date.today())
+    start = parse_day(query.get("start"), end - timedelta(days=DEFAULT_DAYS))
+    if start > end:
+        raise ApiError(400, "start is after end")
+
+    columns = [c for c in query.get("columns", "").split(",") if c] or None
+    known = [spec.column for spec in indicator.series]
+    unknown = [c for c in columns or [] if c not in known]
+    if unknown:
+        raise ApiError(400, f"unknown columns {unknown}; {name} has {known}")
+
+    try:
+        df = client.fetch_shared(name, start.strftime(DATE_FMT), end.strftime(DATE_FMT), columns)
+    except CircuitOpenError as e:
+        raise ApiError(503, str(e))
+    except Exception as e:
+        logger.warning("Fetching %s failed: %s", name, e)
+        raise ApiError(502, f"upstream error: {e}")
+
+    if "Date" in df.columns:
+        df = df.assign(Date=df["Date"].dt.strftime("%Y-%m-%d"))
+    if fmt == "csv":
+        return df.to_csv(index=False).encode(), "text/csv; charset=utf-8"
+    payload = {
+        "series": name,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "columns": [c for c in df.columns if c != "Date"],
+        "data": records(df),
+    }
+    return json.dumps(payload, separators=(",", ":")).encode(), "application/json"
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 prescribes for If-None-Match
+    candidates = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag in candidates
+
+
+def make_handler(client: TCMBClient):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def send_body(self, status: int, body: bytes, content_type: str, cacheable: bool = False):
+            headers = {"Content-Type": content_type, "Vary": "Accept-Encoding"}
+            etag = None
+            if cacheable:
+                etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+                headers["Cache-Control"] = f"public, max-age={MAX_AGE_SECONDS}"
+            gzipped = len(body) >= GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", "")
+            if etag and gzipped:
+                # The compressed representation needs its own tag
+                etag = etag[:-1] + '-gz"'
+            if etag:
+                headers["ETag"] = etag
+                if etag_matches(self.headers.get("If-None-Match"), etag):
+                    self.send_response(304)
+                    for key, value in headers.items():
+                        self.send_header(key, value)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+            if gzipped:
+                body = gzip.compress(body, compresslevel=6)
+                headers["Content-Encoding"] = "gzip"
+
+            self.send_response(status)
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def send_error_json(self, status: int, message: str):
+            self.send_body(status, json.dumps({"error": message}).encode(), "application/json")
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+            path = parts.path.rstrip("/")
+            try:
+                if path == "/series":
+                    return self.send_body(200, json.dumps(catalog()).encode(), "application/json", cacheable=True)
+                if path == "/metrics":
+                    return self.send_body(200, METRICS.render_prometheus().encode(), "text/plain; version=0.0.4")
+                if path.startswith("/series/"):
+                    name = path[len("/series/"):]
+                    fmt = query.get("format", "json")
+                    if name.endswith(".csv"):
+                        name, fmt = name[:-4], "csv"
+                    elif name.endswith(".json"):
+                        name = name[:-5]
+                    elif "format" not in query and "text/csv" in self.headers.get("Accept", ""):
+                        fmt = "csv"
+                    if fmt not in ("json", "csv"):
+                        raise ApiError(400, "format must be json or csv")
+                    body, content_type = series_body(client, name, query, fmt)
+                    return self.send_body(200, body, content_type, cacheable=True)
+                raise ApiError(404, "not found")
+            except ApiError as e:
+                self.send_error_json(e.status, str(e))
+
+    return Handler
+
+
+def serve(host: str = "127.0.0.1", port: int = 8600, client: TCMBClient = None) -> ThreadingHTTPServer:
+    """
+    Start the API on a background thread and return it; call shutdown() to stop.
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(client or TCMBClient()))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="data-api", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(TCMBClient()))
+    logger.info("Data API listening on http://%s:%s/series", args.host, args.port)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Record mock EVDS fixtures from the live API: one CSV (date,value) per series in the registry.
+The mock server serves recorded series as is and synthesizes everything else.
+
+    TCMB_API_KEY=... python -m tools.mock_evds.make_fixtures
+"""
+import argparse
+import csv
+import os
+from datetime import date, datetime
+from data.fetchers.registry import SERIES_BY_CODE, DAILY
+from tools.mock_evds import synthetic
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+DAILY_START = date(2015, 1, 1)
+MONTHLY_START = date(2005, 1, 1)
+
+
+def fixture_path(code: str) -> str:
+    return os.path.join(FIXTURES_DIR, f"{code}.csv")
+
+
+def write_fixture(code: str, rows: list):
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    with open(fixture_path(code), "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["date", "value"])
+        for day, val in rows:
+            writer.writerow([day.isoformat(), "" if val is None else val])
+
+
+def record(code: str, frequency: int, start: date, end: date) -> list:
+    """
+    Fetch one series from the live EVDS API through TCMBClient's request path.
+    """
+    from data.fetchers.tcmb import TCMBClient
+    client = TCMBClient()
+    df = client._request_items([code], start.strftime("%d-%m-%Y"), end.strftime("%d-%m-%Y"), frequency)
+    col = code.replace(".", "_")
+    if df.empty or col not in df.columns:
+        return []
+    return [
+        (ts.date(), None if val != val else float(val))
+        for ts, val in zip(df["Date"], df[col])
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--end", default=synthetic.ANCHOR_END.isoformat(), help="last date to include (YYYY-MM-DD)")
+    parser.add_argument("codes", nargs="*", help="series codes to record (default: every registered series)")
+    args = parser.parse_args()
+
+    end = datetime.strptime(args.end, "%Y-%m-%d").date()
+    for code in args.codes or sorted(SERIES_BY_CODE):
+        spec = SERIES_BY_CODE[code]
+        start = DAILY_START if spec.frequency == DAILY else MONTHLY_START
+        rows = record(code, spec.frequency, start, end)
+        write_fixture(code, rows)
+        print(f"{code}: {len(rows)} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Local stand-in for the EVDS API, for running and measuring the dashboard offline.
+
+    python -m tools.mock_evds.server --port 8765 --latency 0.2 --error-rate 0.05
+    TCMB_BASE_URL=http://127.0.0.1:8765/igmevdsms-dis TCMB_API_KEY=mock streamlit run app.py
+
+Serves the same URL shape TCMBClient builds (/igmevdsms-dis/series=...&startDate=...) with
+deterministic synthetic values for every registered series (tools/mock_evds/synthetic.py).
+Series recorded from EVDS into tools/mock_evds/fixtures (make_fixtures) are served as recorded.
+Latency, errors and payload size can be set on the command line or changed at runtime with
+GET /_mock/config?latency=0.5&error_rate=0.1.
+GET /_mock/stats returns request counters.
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import threading
+import time
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, unquote, urlsplit
+from zoneinfo import ZoneInfo
+from tools.mock_evds import synthetic
+from tools.mock_evds.make_fixtures import FIXTURES_DIR
+
+# EVDS timestamps are local midnights in Turkey
+EVDS_TZ = ZoneInfo("Europe/Istanbul")
+
+
+def load_fixtures(directory: str = FIXTURES_DIR) -> dict:
+    """
+    {code: {date: value or None}} from every fixture CSV in the directory, if there is one.
+    """
+    fixtures = {}
+    if not os.path.isdir(directory):
+        return fixtures
+    for name in os.listdir(directory):
+        if not name.endswith(".csv"):
+            continue
+        with open(os.path.join(directory, name), newline="") as f:
+            fixtures[name[:-4]] = {
+                date.fromisoformat(row["date"]): (float(row["value"]) if row["value"] else None)
+                for row in csv.DictReader(f)
+            }
+    return fixtures
+
+
+class MockConfig:
+    """
+    Fault and load knobs, shared by all handler threads.
+
+    latency/jitter: seconds added to every response.
+    error_rate/error_status: fraction of requests answered with an HTTP error.
+    extra_fields: dummy fields added to every item, to inflate payload size.
+    synthesize: serve synthetic values for dates and series outside the fixtures (on by default).
+    """
+    FIELDS = {"latency": float, "jitter": float, "error_rate": float, "error_status": int, "extra_fields": int, "synthesize": bool}
+
+    def __init__(self, **kwargs):
+        self.latency = 0.0
+        self.jitter = 0.0
+        self.error_rate = 0.0
+        self.error_status = 500
+        self.extra_fields = 0
+        self.synthesize = True
+        self.update(kwargs)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.bytes_sent = 0
+
+    def update(self, values: dict):
+        for key, value in values.items():
+            if key in self.FIELDS and value is not None:
+                cast = self.FIELDS[key]
+                if cast is bool and isinstance(value, str):
+                    value = value.lower() in ("1", "true", "yes")
+                setattr(self, key, cast(value))
+
+    def as_dict(self) -> dict:
+        return {key: getattr(self, key) for key in self.FIELDS}
+
+
+def build_items(fixtures: dict, config: MockConfig, codes: list, start: date, end: date) -> list:
+    """
+    EVDS-shaped items for the requested series and window.
+    """
+    rows = {}
+    for code in codes:
+        series = fixtures.get(code, {})
+        col = code.replace(".", "_")
+        for day in synthetic.dates(code, start, end):
+            if day in series:
+                val = series[day]
+            elif config.synthesize:
+                val = synthetic.value(code, day)
+            else:
+                continue
+            rows.setdefault(day, {})[col] = None if val is None else f"{val:.4f}"
+
+    daily = any(synthetic.is_daily(code) for code in codes)
+    items = []
+    for day in sorted(rows):
+        item = {"Tarih": day.strftime("%d-%m-%Y") if daily else f"{day.year}-{day.month}"}
+        for code in codes:
+            item[code.replace(".", "_")] = rows[day].get(code.replace(".", "_"))
+        stamp = datetime(day.year, day.month, day.day, tzinfo=EVDS_TZ).timestamp()
+        item["UNIXTIME"] = {"$numberLong": str(int(stamp))}
+        for i in range(config.extra_fields):
+            item[f"EXTRA_{i}"] = f"{i:08d}"
+        items.append(item)
+    return items
+
+
+def parse_evds_path(path: str) -> dict:
+    """
+    Query parameters from the path-embedded EVDS query string, e.g. /igmevdsms-dis/series=A-B&startDate=...
+    """
+    last = unquote(urlsplit(path).path).rsplit("/", 1)[-1]
+    return dict(parse_qsl(last, keep_blank_values=True))
+
+
+def make_handler(fixtures: dict, config: MockConfig):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def send_json(self, status: int, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            with config.lock:
+                config.bytes_sent += len(body)
+
+        def do_GET(self):
+            parts = urlsplit(self.path)
+            if parts.path == "/_mock/config":
+                config.update(dict(parse_qsl(parts.query)))
+                return self.send_json(200, config.as_dict())
+            if parts.path == "/_mock/stats":
+                return self.send_json(200, {"requests": config.requests, "errors": config.errors, "bytes_sent": config.bytes_sent})
+
+            with config.lock:
+                config.requests += 1
+            delay = config.latency + random.uniform(0, config.jitter)
+            if delay:
+                time.sleep(delay)
+            if random.random() < config.error_rate:
+                with config.lock:
+                    config.errors += 1
+                return self.send_json(config.error_status, {"error": "injected failure"})
+
+            params = parse_evds_path(self.path)
+            try:
+                codes = [c for c in params["series"].split("-") if c]
+                start = datetime.strptime(params["startDate"], "%d-%m-%Y").date()
+                end = datetime.strptime(params["endDate"], "%d-%m-%Y").date()
+            except (KeyError, ValueError):
+                return self.send_json(400, {"error": "expected series, startDate and endDate"})
+
+            items = build_items(fixtures, config, codes, start, end)
+            self.send_json(200, {"totalCount": len(items), "items": items})
+
+    return Handler
+
+
+def serve(host: str = "127.0.0.1", port: int = 8765, config: MockConfig = None, fixtures: dict = None) -> ThreadingHTTPServer:
+    """
+    Start the mock server on a background thread and return it; call shutdown() to stop.
+    Port 0 picks a free port (see server.server_address).
+    """
+    server = ThreadingHTTPServer((host, port), make_handler(fixtures or load_fixtures(), config or MockConfig()))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="mock-evds", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random seconds, uniform in [0, jitter]")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests that fail")
+    parser.add_argument("--error-status", type=int, default=500, help="HTTP status for injected failures")
+    parser.add_argument("--extra-fields", type=int, default=0, help="dummy fields per item, to inflate payloads")
+    parser.add_argument("--no-synthesize", dest="synthesize", action="store_false", help="serve recorded fixtures only")
+    args = parser.parse_args()
+
+    config = MockConfig(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+        error_status=args.error_status, extra_fields=args.extra_fields, synthesize=args.synthesize,
+    )
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(load_fixtures(), config))
+    print(f"Mock EVDS listening on http://{args.host}:{args.port}/igmevdsms-dis")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
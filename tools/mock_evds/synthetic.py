@@ -0,0 +1,102 @@
+import math
+import zlib
+from datetime import date, timedelta
+
+# Rough yearly level anchors for each dashboard series, interpolated log-linearly, plus a noise amplitude.
+# Good enough to exercise charts, deltas and YoY maths; not real data.
+ANCHOR_END = date(2026, 9, 30)
+LEVELS = {
+    "TP.DK.USD.A": ({2005: 1.35, 2015: 2.3, 2018: 3.8, 2021: 7.4, 2022: 13.0, 2023: 18.7, 2024: 29.5, 2025: 35.4, 2026: 41.5}, 0.004),
+    "TP.DK.EUR.A": ({2005: 1.80, 2015: 2.8, 2018: 4.5, 2021: 9.0, 2022: 14.6, 2023: 20.1, 2024: 32.6, 2025: 37.1, 2026: 48.6}, 0.004),
+    "TP.DK.GBP.A": ({2005: 2.55, 2015: 3.6, 2018: 5.1, 2021: 10.3, 2022: 16.6, 2023: 22.5, 2024: 37.6, 2025: 44.5, 2026: 55.9}, 0.004),
+    "TP.APIFON4": ({2005: 18.0, 2015: 8.5, 2018: 16.0, 2021: 18.5, 2022: 14.0, 2023: 9.0, 2024: 43.0, 2025: 50.0, 2026: 40.5}, 0.0),
+    "TP.FG.J0": ({2005: 113.9, 2015: 236.6, 2018: 319.0, 2021: 514.0, 2022: 687.0, 2023: 1130.0, 2024: 1985.0, 2025: 2680.0, 2026: 3350.0}, 0.0),
+    "TP.KKO.MA": ({2005: 80.0, 2015: 74.6, 2021: 75.0, 2024: 76.5, 2026: 74.2}, 0.015),
+    "TP.TIG08": ({2005: 10.5, 2015: 10.3, 2021: 12.0, 2024: 9.4, 2026: 8.6}, 0.03),
+    "TP.TIG07": ({2005: 46.5, 2015: 51.4, 2021: 51.0, 2024: 53.3, 2026: 53.4}, 0.01),
+}
+DEFAULT_LEVEL = ({2005: 10.0, 2026: 50.0}, 0.005)
+# Rough TRY value of one unit of the other panel currencies relative to USD; they follow the USD anchors
+USD_CROSS = {
+    "CHF": 1.1, "JPY": 0.0075, "AUD": 0.66, "CAD": 0.74, "DKK": 0.145, "SEK": 0.095, "NOK": 0.093, "KWD": 3.25,
+    "SAR": 0.267, "BGN": 0.55, "RON": 0.22, "RUB": 0.012, "IRR": 0.000024, "CNY": 0.14, "PKR": 0.0036,
+    "QAR": 0.275, "KRW": 0.00073, "AZN": 0.59, "AED": 0.272,
+}
+# Spread of the other rate types over forex buying, by EVDS code suffix
+RATE_SPREADS = {"A": 1.0, "S": 1.002, "A.EF": 0.998, "S.EF": 1.005}
+DAILY_CODES = {"TP.DK.USD.A", "TP.DK.EUR.A", "TP.DK.GBP.A", "TP.APIFON4"}
+
+
+def _noise(code: str, day: date) -> float:
+    """
+    Deterministic pseudo-random number in [-1, 1] for a series and date.
+    """
+    h = zlib.crc32(f"{code}:{day.isoformat()}".encode())
+    return (h / 0xFFFFFFFF) * 2 - 1
+
+
+def _level(anchors: dict, day: date) -> float:
+    years = sorted(anchors)
+    t = day.year + (day.timetuple().tm_yday - 1) / 366
+    if t <= years[0]:
+        return anchors[years[0]]
+    for lo, hi in zip(years, years[1:]):
+        if t <= hi:
+            w = (t - lo) / (hi - lo)
+            return anchors[lo] * math.exp(math.log(anchors[hi] / anchors[lo]) * w)
+    return anchors[years[-1]]
+
+
+def is_daily(code: str) -> bool:
+    return code in DAILY_CODES or code.startswith("TP.DK.")
+
+
+def value(code: str, day: date):
+    """
+    Synthetic observation for a series on a date, or None where EVDS reports no value
+    (weekends for daily series). Deterministic, so the same request always returns the same payload.
+    """
+    if is_daily(code) and day.weekday() >= 5:
+        return None
+    anchors, noise = LEVELS.get(code, DEFAULT_LEVEL)
+    scale = 1.0
+    noise_code = code
+    if code.startswith("TP.DK.") and code.count(".") >= 3 and code not in LEVELS:
+        # Panel series: another rate type of a base currency, or a cross of USD
+        _, _, currency, suffix = code.split(".", 3)
+        base = noise_code = f"TP.DK.{currency}.A"
+        if base in LEVELS:
+            anchors, noise = LEVELS[base]
+        elif currency in USD_CROSS:
+            anchors, noise = LEVELS["TP.DK.USD.A"]
+            scale = USD_CROSS[currency]
+        scale *= RATE_SPREADS.get(suffix, 1.0)
+    level = _level(anchors, day) * scale
+    if code == "TP.APIFON4":
+        # Policy-style rate: moves in 25bp steps, holds within a month
+        month = date(day.year, day.month, 1)
+        return round(level * 4 + _noise(code, month)) / 4
+    return round(level * (1 + noise * _noise(noise_code, day)), 6 if level < 1 else 4)
+
+
+def dates(code: str, start: date, end: date) -> list:
+    """
+    Observation dates EVDS would return for a series: every calendar day for daily series,
+    the first of each month for monthly ones.
+    """
+    out = []
+    if is_daily(code):
+        day = start
+        while day <= end:
+            out.append(day)
+            day += timedelta(days=1)
+    else:
+        year, month = start.year, start.month
+        if start.day > 1:
+            month += 1
+            if month > 12:
+                year, month = year + 1, 1
+        while date(year, month, 1) <= end:
+            out.append(date(year, month, 1))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return out
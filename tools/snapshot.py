@@ -0,0 +1,171 @@
+"""
+Pre-render the Overview to a static site that any plain file server can host.
+
+    python -m tools.snapshot --output site/
+
+Fetches every Overview indicator once through TCMBClient and writes:
+
+    index.html            the Overview page: metric cards plus charts rendered client-side by vega-embed
+    data/<name>.parquet   the full indicator frames
+    specs/<chart>.vl.json Vega-Lite specs of every chart, data inlined
+    manifest.json         generation time, fetch window and latest values
+
+The new snapshot replaces the old one only once it is complete, and nothing is replaced if any
+indicator fails to load, so a scheduled run (e.g. cron every 15 minutes) never publishes a broken page.
+"""
+import argparse
+import html
+import json
+import logging
+import os
+import shutil
+import sys
+from datetime import datetime, timedelta
+import pandas as pd
+from config.settings import CHART_WIDTH_PX, PAGE_ICON, PAGE_TITLE
+from components.overview import CHART_DAYS, FETCH_DAYS, SECTION_ROWS, SECTION_TITLES, SECTION_VIEWS
+from components.view_models import build_view, chart_start_for
+from data.fetchers.tcmb import DATE_FMT, TCMBClient
+
+logger = logging.getLogger(__name__)
+
+PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<script src="https://cdn.jsdelivr.net/npm/vega@5"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-lite@5"></script>
+<script src="https://cdn.jsdelivr.net/npm/vega-embed@6"></script>
+<style>
+body {{ font-family: sans-serif; margin: 0 auto; max-width: 1400px; padding: 24px; background: #F8F9FA; color: #333; }}
+.row {{ display: flex; gap: 24px; align-items: center; margin-bottom: 16px; }}
+.card {{ flex: 1; background: white; padding: 20px; border-radius: 10px; border: 1px solid #eee; box-shadow: 0 2px 4px rgba(0,0,0,0.05); }}
+.card .title {{ color: #666; font-size: 14px; }}
+.card .value {{ font-size: 24px; font-weight: bold; }}
+.card .delta {{ font-size: 14px; color: #666; }}
+.chart {{ flex: 3; min-width: 0; }}
+footer {{ color: #95A5A6; font-size: 12px; margin-top: 32px; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<h2>🇹🇷 Executive Summary</h2>
+<p>Key economic indicators at a glance.</p>
+{sections}
+<footer>Data: TCMB EVDS. Charts display data for the last 1 year. Generated {generated}.</footer>
+<script>
+const specs = {specs};
+for (const [id, spec] of Object.entries(specs)) {{
+  vegaEmbed("#" + id, spec, {{actions: false}});
+}}
+</script>
+</body>
+</html>
+"""
+
+
+def fetch_frames(client: TCMBClient, end: datetime) -> dict:
+    """
+    {name: frame} for every Overview indicator; raises if any of them came back empty.
+    """
+    start = end - timedelta(days=FETCH_DAYS)
+    frames = client.fetch_indicators(start.strftime(DATE_FMT), end.strftime(DATE_FMT), list(SECTION_TITLES))
+    missing = [name for name in SECTION_TITLES if frames.get(name) is None or frames[name].empty]
+    if missing:
+        raise RuntimeError(f"no data for {', '.join(missing)}")
+    return frames
+
+
+def render_card(card) -> str:
+    if card is None:
+        return '<div class="card">No Data</div>'
+    title, value, delta, description = (html.escape(str(part)) for part in card)
+    return (
+        f'<div class="card" title="{description}"><div class="title">{title}</div>'
+        f'<div class="value">{value}</div><div class="delta">{delta}</div></div>'
+    )
+
+
+def build_site(frames: dict, directory: str, generated: datetime):
+    """
+    Write the snapshot files for the given indicator frames into directory.
+    """
+    os.makedirs(os.path.join(directory, "data"))
+    os.makedirs(os.path.join(directory, "specs"))
+
+    chart_start = chart_start_for(CHART_DAYS, pd.Timestamp(generated))
+    points = int(CHART_WIDTH_PX * 0.75)
+    sections, specs, latest = [], {}, {}
+    for name, title in SECTION_TITLES.items():
+        df = frames[name]
+        df.to_parquet(os.path.join(directory, "data", f"{name}.parquet"), index=False)
+
+        view = build_view(df, SECTION_VIEWS[name], chart_start, points)
+        latest[name] = {column: {"value": m.value, "delta": m.delta} for column, m in view.metrics.items()}
+
+        rows = []
+        for i, (card, chart) in enumerate(SECTION_ROWS[name](view)):
+            chart_html = ""
+            if chart is not None:
+                chart_id = f"{name}_{i}"
+                specs[chart_id] = chart.properties(width="container").to_dict()
+                with open(os.path.join(directory, "specs", f"{chart_id}.vl.json"), "w") as f:
+                    json.dump(specs[chart_id], f)
+                chart_html = f'<div class="chart" id="{chart_id}"></div>'
+            rows.append(f'<div class="row">{render_card(card)}{chart_html}</div>')
+        sections.append(f"<h3>{html.escape(title.lstrip('# '))}</h3>\n" + "\n".join(rows) + "\n<hr>")
+
+    page = PAGE.format(
+        title=html.escape(f"{PAGE_ICON} {PAGE_TITLE}"),
+        sections="\n".join(sections),
+        specs=json.dumps(specs).replace("</", "<\\/"),
+        generated=generated.strftime("%Y-%m-%d %H:%M"),
+    )
+    with open(os.path.join(directory, "index.html"), "w") as f:
+        f.write(page)
+
+    manifest = {
+        "generated_at": generated.isoformat(timespec="seconds"),
+        "window": {"start": (generated - timedelta(days=FETCH_DAYS)).date().isoformat(), "end": generated.date().isoformat()},
+        "indicators": {name: {"rows": len(frames[name]), "latest": latest[name]} for name in SECTION_TITLES},
+    }
+    with open(os.path.join(directory, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def publish(build_dir: str, output: str):
+    """
+    Swap a finished build into place, keeping the old snapshot until the new one is there.
+    """
+    previous = f"{output}.previous"
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(output):
+        os.rename(output, previous)
+    os.rename(build_dir, output)
+    shutil.rmtree(previous, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="site", help="directory to write the snapshot to")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    output = os.path.abspath(args.output)
+    build_dir = f"{output}.build-{os.getpid()}"
+    generated = datetime.now()
+    try:
+        frames = fetch_frames(TCMBClient(), generated)
+        build_site(frames, build_dir, generated)
+        publish(build_dir, output)
+    except Exception as e:
+        shutil.rmtree(build_dir, ignore_errors=True)
+        logger.error("Snapshot failed, keeping the previous one: %s", e)
+        sys.exit(1)
+    logger.info("Snapshot written to %s", output)
+
+
+if __name__ == "__main__":
+    main()